@@ -6,14 +6,19 @@ Reads all cells in a file and downloads any external file links to a specified f
 
 import argparse
 import csv
+import functools
+import io
 import os
 import re
 import sys
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, List, Optional, Set, Tuple, Union
 from urllib.parse import urlparse, unquote
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
+from xml.etree import ElementTree
 
 try:
     import openpyxl
@@ -27,11 +32,57 @@ try:
 except ImportError:
     XLRD_AVAILABLE = False
 
+try:
+    import urllib3
+    URLLIB3_AVAILABLE = True
+except ImportError:
+    URLLIB3_AVAILABLE = False
+
+
+# URL pattern to detect external links: the scheme followed by any characters
+# allowed in a URL (stops at whitespace and characters RFC 3986 forbids unescaped)
+URL_PATTERN = re.compile(r'https?://[^\s<>"{}|\\^`]+')
+
+# Default and maximum number of files downloaded at the same time
+DEFAULT_DOWNLOAD_WORKERS = 8
+MAX_DOWNLOAD_WORKERS = 32
+
+# Size of the chunks a response body is copied to disk with; chunks this large are
+# written straight to the file (bypassing its buffer) with one read and one write
+# syscall each, and with MAX_DOWNLOAD_WORKERS downloads hold at most 32 MiB at once
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Bytes a download has to write before its pages are synced and dropped from the
+# page cache; smaller files are left to normal writeback
+PAGE_CACHE_DROP_THRESHOLD = 16 * 1024 * 1024
+
+# Request headers sent with every download (a user agent avoids blocking)
+DOWNLOAD_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# Shared connection pool, so URLs on the same host reuse keep-alive connections
+# instead of paying a new TCP/TLS handshake per file
+_POOL = urllib3.PoolManager(
+    num_pools=16,
+    maxsize=MAX_DOWNLOAD_WORKERS,
+    headers=DOWNLOAD_HEADERS
+) if URLLIB3_AVAILABLE else None
+
+# Suffix of incomplete downloads, kept so an interrupted download can be resumed
+PARTIAL_DOWNLOAD_SUFFIX = '.part'
+
+# Suffix of the file next to a partial download that holds the ETag or Last-Modified
+# value of its response; a download is only resumed with a matching If-Range
+PARTIAL_VALIDATOR_SUFFIX = '.validator'
+
+# Start offset of a 206 response ("Content-Range: bytes <start>-<end>/<size>")
+CONTENT_RANGE_PATTERN = re.compile(r'bytes\s+(\d+)-')
 
-# URL pattern to detect external links
-URL_PATTERN = re.compile(
-    r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-)
+# Network errors reported as regular download failures
+DOWNLOAD_ERRORS = (URLError, HTTPError, TimeoutError)
+if URLLIB3_AVAILABLE:
+    DOWNLOAD_ERRORS += (urllib3.exceptions.HTTPError,)
 
 
 def extract_urls_from_text(text: str) -> List[str]:
@@ -39,7 +90,7 @@ def extract_urls_from_text(text: str) -> List[str]:
     Extract all URLs from a text string.
 
     Args:
-        text: Text to search for URLs
+        text: Text to search for URLs (other cell values are converted to str)
 
     Returns:
         List of URLs found in the text
@@ -47,13 +98,19 @@ def extract_urls_from_text(text: str) -> List[str]:
     if not isinstance(text, str):
         text = str(text)
 
+    # Cheap substring check first, most cells contain no URL at all
+    if 'http' not in text:
+        return []
+
     urls = URL_PATTERN.findall(text)
     return urls
 
 
+@functools.lru_cache(maxsize=8192)
 def get_filename_from_url(url: str) -> str:
     """
     Extract filename from URL. If no filename found, generate one.
+    Results are cached, since the same URLs are often resolved more than once.
 
     Args:
         url: The URL to extract filename from
@@ -76,10 +133,140 @@ def get_filename_from_url(url: str) -> str:
     return filename
 
 
-def download_file(url: str, output_path: Path) -> bool:
+@functools.lru_cache(maxsize=8192)
+def get_target_filename(original_filename: str, custom_name: str) -> str:
+    """
+    Determine the name a downloaded file is saved under.
+
+    Args:
+        original_filename: Filename taken from the URL
+        custom_name: Custom filename from the name column (may be empty)
+
+    Returns:
+        custom_name as is if it has an extension, custom_name plus the original
+        extension otherwise, or original_filename when there is no custom name
+    """
+    if not custom_name:
+        return original_filename
+
+    # If custom_name already has extension, use it as is, otherwise add original extension
+    if os.path.splitext(custom_name)[1]:
+        return custom_name
+    return custom_name + os.path.splitext(original_filename)[1]
+
+
+def save_chunks(chunks: Iterable[bytes], output_path: Union[str, Path], append: bool = False) -> None:
+    """
+    Stream response body chunks to a file, so memory use does not grow with file size.
+
+    Args:
+        chunks: Iterable of body chunks
+        output_path: Path where to save the file
+        append: Append to an existing file instead of overwriting it
+    """
+    written = 0
+    with open(output_path, 'ab' if append else 'wb') as f:
+        for chunk in chunks:
+            written += f.write(chunk)
+
+        # Large downloads are not read back, so keep them from crowding other
+        # data out of the page cache. DONTNEED only drops clean pages, so the
+        # data is written out first; small files skip the sync, which would
+        # only make the worker wait for the disk. This is only advice:
+        # filesystems that don't support it (e.g. some network mounts) must
+        # not fail a download that has already been written
+        if written >= PAGE_CACHE_DROP_THRESHOLD and hasattr(os, 'posix_fadvise'):
+            f.flush()
+            try:
+                os.fdatasync(f.fileno())
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            except OSError:
+                pass
+
+
+def get_validator(headers) -> Optional[str]:
+    """
+    Get the value a later If-Range request can use to check that a resource is unchanged.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        The strong ETag, else the Last-Modified date, or None if the response has neither
+        (weak ETags are not allowed in If-Range)
+    """
+    etag = headers.get('ETag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return headers.get('Last-Modified')
+
+
+def discard_partial_download(part_path: str) -> None:
+    """
+    Remove a partial download and its validator file, if they exist.
+
+    Args:
+        part_path: Path of the partial download
+    """
+    for path in (part_path, part_path + PARTIAL_VALIDATOR_SUFFIX):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def save_response(status: int, headers, chunks: Iterable[bytes], part_path: str, offset: int) -> bool:
+    """
+    Save a 200 or 206 response body to a partial download file.
+
+    A 200 response starts the file over and stores the response's validator next to
+    it, so an interrupted download can be resumed later. A 206 response is appended
+    only if it starts exactly at the end of the partial file.
+
+    Args:
+        status: HTTP status code of the response
+        headers: Response headers
+        chunks: Iterable of body chunks
+        part_path: Path of the partial download
+        offset: Current size of the partial download (the requested range start)
+
+    Returns:
+        True if the body was saved, False if a 206 response does not continue the partial file
+    """
+    if status == 206:
+        match = CONTENT_RANGE_PATTERN.match(headers.get('Content-Range', ''))
+        if not match or int(match.group(1)) != offset:
+            return False
+        save_chunks(chunks, part_path, append=True)
+        return True
+
+    validator_path = part_path + PARTIAL_VALIDATOR_SUFFIX
+    validator = get_validator(headers)
+    if validator:
+        with open(validator_path, 'w', encoding='utf-8') as f:
+            f.write(validator)
+    else:
+        # Without a validator a leftover partial file can't be resumed safely
+        try:
+            os.remove(validator_path)
+        except FileNotFoundError:
+            pass
+
+    save_chunks(chunks, part_path)
+    return True
+
+
+def download_file(url: str, output_path: Union[str, Path]) -> bool:
     """
     Download a file from URL to the specified path.
 
+    Data is written to a "<name>.part" file first and renamed when complete, so an
+    interrupted download never looks finished. If a .part file is left over from an
+    earlier attempt, the download resumes from its end with a Range request. The
+    ETag or Last-Modified value of the first response is kept next to the .part
+    file and sent as If-Range, so the server sends the whole file again if it has
+    changed; a .part file without a validator is downloaded again from the start.
+
     Args:
         url: URL to download from
         output_path: Path where to save the file
@@ -87,25 +274,76 @@ def download_file(url: str, output_path: Path) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    part_path = f"{output_path}{PARTIAL_DOWNLOAD_SUFFIX}"
+    offset = 0
     try:
-        # Create a request with a user agent to avoid blocking
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        request = Request(url, headers=headers)
-
-        # Download the file
-        with urlopen(request, timeout=30) as response:
-            # Read the file content
-            content = response.read()
-
-            # Save to file
-            with open(output_path, 'wb') as f:
-                f.write(content)
+        with open(part_path + PARTIAL_VALIDATOR_SUFFIX, encoding='utf-8') as f:
+            validator = f.read().strip()
+        if validator:
+            offset = os.path.getsize(part_path)
+    except OSError:
+        pass
+
+    headers = dict(DOWNLOAD_HEADERS)
+    if offset:
+        headers['Range'] = f'bytes={offset}-'
+        headers['If-Range'] = validator
 
+    try:
+        if URLLIB3_AVAILABLE:
+            # Download the file over a pooled connection
+            response = _POOL.request('GET', url, headers=headers, timeout=30.0, preload_content=False)
+            try:
+                if response.status == 416 and offset:
+                    # The partial file doesn't match the resource anymore, start over
+                    response.drain_conn()
+                    discard_partial_download(part_path)
+                    return download_file(url, output_path)
+
+                if response.status >= 400:
+                    print(f"Error downloading {url}: HTTP Error {response.status}: {response.reason}")
+                    response.drain_conn()
+                    return False
+
+                # 206 continues the partial file, 200 means the server sent everything
+                saved = save_response(response.status, response.headers,
+                                      response.stream(DOWNLOAD_CHUNK_SIZE), part_path, offset)
+                if not saved:
+                    response.drain_conn()
+            finally:
+                response.release_conn()
+        else:
+            request = Request(url, headers=headers)
+
+            try:
+                response = urlopen(request, timeout=30)
+            except HTTPError as e:
+                if e.code == 416 and offset:
+                    # The partial file doesn't match the resource anymore, start over
+                    discard_partial_download(part_path)
+                    return download_file(url, output_path)
+                raise
+
+            with response:
+                saved = save_response(response.status, response.headers,
+                                      iter(lambda: response.read(DOWNLOAD_CHUNK_SIZE), b''), part_path, offset)
+
+        if not saved:
+            if not offset:
+                print(f"Error downloading {url}: unexpected partial response")
+                return False
+            # The range the server sent doesn't continue the partial file, start over
+            discard_partial_download(part_path)
+            return download_file(url, output_path)
+
+        os.replace(part_path, output_path)
+        try:
+            os.remove(part_path + PARTIAL_VALIDATOR_SUFFIX)
+        except FileNotFoundError:
+            pass
         return True
 
-    except (URLError, HTTPError, TimeoutError) as e:
+    except DOWNLOAD_ERRORS as e:
         print(f"Error downloading {url}: {str(e)}")
         return False
     except Exception as e:
@@ -113,7 +351,8 @@ def download_file(url: str, output_path: Path) -> bool:
         return False
 
 
-def read_csv_file(file_path: Path, column_index_name: int = None, column_index_url: int = -1) -> List[Tuple[str, str]]:
+def read_csv_file(file_path: Path, column_index_name: int = None, column_index_url: int = -1,
+                  seen: Optional[Set[str]] = None) -> List[Tuple[str, str]]:
     """
     Read CSV file and extract all URLs from cells.
 
@@ -121,125 +360,353 @@ def read_csv_file(file_path: Path, column_index_name: int = None, column_index_u
         file_path: Path to CSV file
         column_index_name: Optional column index for custom filename (0-based)
         column_index_url: Column index where URLs are located (0-based). If -1, check all cells.
+        seen: Optional set of already collected URLs, shared between calls. URLs in it are
+              skipped and new ones are added to it.
 
     Returns:
-        List of tuples (URL, custom_filename) found in the file
+        List of tuples (URL, custom_filename) found in the file, without duplicate URLs
     """
     url_data = []
+    if seen is None:
+        seen = set()
 
     try:
-        with open(file_path, 'r', encoding='utf-8', newline='') as f:
-            reader = csv.reader(f)
-            for row in reader:
+        # Decode the whole file up front so a cp1251 fallback never re-reads
+        # rows that were already scanned as UTF-8
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        try:
+            content = data.decode('utf-8')
+        except UnicodeDecodeError:
+            content = data.decode('cp1251')
+        del data
+
+        reader = csv.reader(io.StringIO(content, newline=''))
+        for row in reader:
+            # Determine which text to check for URLs
+            if column_index_url >= 0:
+                # Check only the specified column
+                text = row[column_index_url] if column_index_url < len(row) else ""
+            else:
+                # Check all cells with a single regex pass over the row; the newline
+                # separator ends a URL just like a cell boundary does
+                text = '\n'.join(row)
+
+            if 'http' in text:
+                # The name column only matters for rows that contain URLs
                 custom_name = ""
                 if column_index_name is not None and column_index_name < len(row):
                     custom_name = row[column_index_name].strip() if row[column_index_name] else ""
 
-                # Determine which cells to check for URLs
-                if column_index_url >= 0:
-                    # Check only the specified column
-                    cells_to_check = [row[column_index_url]] if column_index_url < len(row) else []
-                else:
-                    # Check all cells
-                    cells_to_check = row
-
-                for cell in cells_to_check:
-                    if cell:
-                        found_urls = extract_urls_from_text(cell)
-                        for url in found_urls:
-                            url_data.append((url, custom_name))
-    except UnicodeDecodeError:
-        # Try with different encoding
-        try:
-            with open(file_path, 'r', encoding='cp1251', newline='') as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    custom_name = ""
-                    if column_index_name is not None and column_index_name < len(row):
-                        custom_name = row[column_index_name].strip() if row[column_index_name] else ""
-
-                    # Determine which cells to check for URLs
-                    if column_index_url >= 0:
-                        # Check only the specified column
-                        cells_to_check = [row[column_index_url]] if column_index_url < len(row) else []
-                    else:
-                        # Check all cells
-                        cells_to_check = row
-
-                    for cell in cells_to_check:
-                        if cell:
-                            found_urls = extract_urls_from_text(cell)
-                            for url in found_urls:
-                                url_data.append((url, custom_name))
-        except Exception as e:
-            print(f"Error reading CSV file {file_path}: {str(e)}")
+                for url in URL_PATTERN.findall(text):
+                    if url not in seen:
+                        seen.add(url)
+                        url_data.append((url, custom_name))
     except Exception as e:
         print(f"Error reading CSV file {file_path}: {str(e)}")
 
     return url_data
 
 
-def read_xlsx_file(file_path: Path, column_index_name: int = None, column_index_url: int = -1) -> List[Tuple[str, str]]:
+# SpreadsheetML namespaces used by the XLSX fast path
+XLSX_MAIN_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+XLSX_REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+XLSX_PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+
+def _xlsx_column_index(reference: str) -> int:
+    """
+    Convert the column letters of a cell reference (e.g. "AB12") to a 0-based index.
+
+    Args:
+        reference: Cell reference from the "r" attribute
+
+    Returns:
+        0-based column index
+    """
+    index = 0
+    for char in reference:
+        if not char.isalpha():
+            break
+        index = index * 26 + (ord(char.upper()) - 64)
+    return index - 1
+
+
+def _xlsx_cell_position(reference: str) -> Tuple[int, int]:
+    """
+    Split a cell reference (e.g. "AB12") into its row number and 0-based column index.
+
+    Args:
+        reference: Cell reference
+
+    Returns:
+        Tuple of (1-based row number, 0-based column index)
+    """
+    letters = reference.rstrip('0123456789')
+    return int(reference[len(letters):]), _xlsx_column_index(letters)
+
+
+def _xlsx_string_item_text(item) -> str:
+    """
+    Get the text of a shared or inline string item (plain or rich text, without phonetic runs).
+
+    Args:
+        item: <si> or <is> element
+
+    Returns:
+        String value
+    """
+    text = item.findtext(XLSX_MAIN_NS + 't')
+    if text is not None:
+        return text
+    return ''.join(run.findtext(XLSX_MAIN_NS + 't') or '' for run in item.iterfind(XLSX_MAIN_NS + 'r'))
+
+
+def _xlsx_hyperlink_targets(archive: zipfile.ZipFile, sheet_path: str, links: List[Tuple[str, str]],
+                            column_index_url: int = -1) -> List[Tuple[int, int, str]]:
+    """
+    Resolve the external hyperlinks of a worksheet through its relationships part.
+
+    Args:
+        archive: Opened XLSX archive
+        sheet_path: Path of the worksheet inside the archive
+        links: (cell reference or range, relationship id) pairs from the <hyperlinks> element
+        column_index_url: Column index where URLs are located (0-based). If -1, keep all cells.
+
+    Returns:
+        List of (row number, column index, target) for every linked cell
+    """
+    folder, _, name = sheet_path.rpartition('/')
+    rels = ElementTree.fromstring(archive.read(f'{folder}/_rels/{name}.rels'))
+    targets = {rel.get('Id'): rel.get('Target') for rel in rels.iter(XLSX_PKG_REL_NS + 'Relationship')}
+
+    cells = []
+    for ref, rel_id in links:
+        target = targets.get(rel_id)
+        if not target:
+            continue
+        # A range links every cell in it, as in openpyxl
+        first, _, last = ref.partition(':')
+        first_row, first_column = _xlsx_cell_position(first)
+        last_row, last_column = _xlsx_cell_position(last) if last else (first_row, first_column)
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                if column_index_url < 0 or column == column_index_url:
+                    cells.append((row, column, target))
+    return cells
+
+
+def scan_xlsx_urls(file_path: Path, column_index_url: int = -1,
+                   scan_hyperlinks: bool = True) -> Optional[List[str]]:
+    """
+    Extract URLs from XLSX cell values and hyperlinks by streaming the sheet XML directly.
+
+    This skips openpyxl entirely: the archive is opened with zipfile and every
+    worksheet is parsed incrementally, so no cell objects are created and memory
+    stays flat regardless of the number of rows. Hyperlink targets are read from
+    the <hyperlinks> element after the sheet data and resolved through the sheet's
+    relationships part.
+
+    Args:
+        file_path: Path to XLSX file
+        column_index_url: Column index where URLs are located (0-based). If -1, check all cells.
+        scan_hyperlinks: Also extract hyperlink targets
+
+    Returns:
+        List of URLs in sheet/row/cell order (a cell's hyperlink before the URLs in its
+        text), or None if the file does not have the standard XLSX layout (the caller
+        should fall back to openpyxl then)
+    """
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            # Resolve worksheet paths in workbook order
+            workbook = ElementTree.fromstring(archive.read('xl/workbook.xml'))
+            rels = ElementTree.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+            targets = {
+                rel.get('Id'): rel.get('Target')
+                for rel in rels.iter(XLSX_PKG_REL_NS + 'Relationship')
+                if rel.get('Type', '').endswith('/worksheet')
+            }
+            sheet_paths = []
+            for sheet in workbook.iter(XLSX_MAIN_NS + 'sheet'):
+                target = targets.get(sheet.get(XLSX_REL_NS + 'id'))
+                if target:
+                    sheet_paths.append(target.lstrip('/') if target.startswith('/') else 'xl/' + target)
+            if not sheet_paths:
+                return None
+
+            shared_strings = []
+            if 'xl/sharedStrings.xml' in archive.namelist():
+                with archive.open('xl/sharedStrings.xml') as fp:
+                    for _, element in ElementTree.iterparse(fp):
+                        if element.tag == XLSX_MAIN_NS + 'si':
+                            shared_strings.append(_xlsx_string_item_text(element))
+                            element.clear()
+
+            urls = []
+            for sheet_path in sheet_paths:
+                # (row, column, URLs) of the cells whose text contains URLs
+                cell_urls = []
+                links = []
+                with archive.open(sheet_path) as fp:
+                    sheet_data = None
+                    row = 0
+                    column = -1
+                    for event, element in ElementTree.iterparse(fp, events=('start', 'end')):
+                        tag = element.tag
+                        if event == 'start':
+                            if tag == XLSX_MAIN_NS + 'sheetData':
+                                sheet_data = element
+                            elif tag == XLSX_MAIN_NS + 'row':
+                                number = element.get('r')
+                                row = int(number) if number else row + 1
+                                column = -1
+                            continue
+
+                        if tag == XLSX_MAIN_NS + 'c':
+                            reference = element.get('r')
+                            column = _xlsx_column_index(reference) if reference else column + 1
+                            if column_index_url >= 0 and column != column_index_url:
+                                continue
+
+                            cell_type = element.get('t')
+                            if cell_type == 's':
+                                value = shared_strings[int(element.findtext(XLSX_MAIN_NS + 'v'))]
+                            elif cell_type == 'inlineStr':
+                                inline = element.find(XLSX_MAIN_NS + 'is')
+                                value = _xlsx_string_item_text(inline) if inline is not None else None
+                            else:
+                                value = element.findtext(XLSX_MAIN_NS + 'v')
+
+                            if value and 'http' in value:
+                                found = URL_PATTERN.findall(value)
+                                if found:
+                                    cell_urls.append((row, column, found))
+                        elif tag == XLSX_MAIN_NS + 'row' and sheet_data is not None:
+                            # Drop parsed rows so memory does not grow with the sheet
+                            sheet_data.clear()
+                        elif tag == XLSX_MAIN_NS + 'hyperlink' and scan_hyperlinks:
+                            # Links to places inside the workbook have no relationship id
+                            rel_id = element.get(XLSX_REL_NS + 'id')
+                            if rel_id and element.get('ref'):
+                                links.append((element.get('ref'), rel_id))
+
+                if not links:
+                    for _, _, found in cell_urls:
+                        urls.extend(found)
+                    continue
+
+                # Merge hyperlink targets into cell order, before the URLs in the same cell's text
+                entries = [(row, column, 1, found) for row, column, found in cell_urls]
+                entries.extend(
+                    (row, column, 0, [target])
+                    for row, column, target in _xlsx_hyperlink_targets(archive, sheet_path, links, column_index_url)
+                )
+                entries.sort(key=lambda entry: entry[:3])
+                for entry in entries:
+                    urls.extend(entry[3])
+            return urls
+    except (KeyError, IndexError, ValueError, TypeError, zipfile.BadZipFile, ElementTree.ParseError):
+        return None
+
+
+def read_xlsx_file(file_path: Path, column_index_name: int = None, column_index_url: int = -1,
+                   scan_hyperlinks: bool = True, seen: Optional[Set[str]] = None) -> List[Tuple[str, str]]:
     """
     Read XLSX file and extract all URLs from cells.
 
+    Without a name column the sheet XML is scanned directly, cell values and
+    hyperlinks alike (see scan_xlsx_urls). With a name column the workbook is
+    loaded with openpyxl; openpyxl's read-only mode is much faster and uses far
+    less memory on large files but does not expose hyperlinks, so it is only used
+    when scan_hyperlinks is False.
+
     Args:
         file_path: Path to XLSX file
         column_index_name: Optional column index for custom filename (0-based)
         column_index_url: Column index where URLs are located (0-based). If -1, check all cells.
+        scan_hyperlinks: Also extract hyperlink targets (with a name column this loads the full workbook)
+        seen: Optional set of already collected URLs, shared between calls. URLs in it are
+              skipped and new ones are added to it.
 
     Returns:
-        List of tuples (URL, custom_filename) found in the file
+        List of tuples (URL, custom_filename) found in the file, without duplicate URLs
     """
+    url_data = []
+    if seen is None:
+        seen = set()
+
+    # Plain URL scan: stream the sheet XML directly when cell objects aren't needed
+    if column_index_name is None:
+        urls = scan_xlsx_urls(file_path, column_index_url, scan_hyperlinks)
+        if urls is not None:
+            for url in urls:
+                if url not in seen:
+                    seen.add(url)
+                    url_data.append((url, ""))
+            return url_data
+
     if not OPENPYXL_AVAILABLE:
         print("Error: openpyxl library is not installed. Install it with: pip install openpyxl")
         return []
 
-    url_data = []
-
     try:
-        workbook = openpyxl.load_workbook(file_path, data_only=True)
+        workbook = openpyxl.load_workbook(file_path, read_only=not scan_hyperlinks, data_only=True)
 
-        # Iterate through all sheets
-        for sheet_name in workbook.sheetnames:
-            sheet = workbook[sheet_name]
-
-            # Iterate through all rows
-            for row in sheet.iter_rows():
-                custom_name = ""
-                if column_index_name is not None and column_index_name < len(row):
-                    cell_value = row[column_index_name].value
-                    custom_name = str(cell_value).strip() if cell_value else ""
+        try:
+            # Iterate through all sheets
+            for sheet in workbook.worksheets:
+                if not scan_hyperlinks:
+                    # Don't trust the stored sheet dimensions, some writers omit them
+                    sheet.reset_dimensions()
+
+                # Iterate through all rows (plain values unless hyperlinks are needed)
+                for row in sheet.iter_rows(values_only=not scan_hyperlinks):
+                    if scan_hyperlinks:
+                        values = [cell.value for cell in row]
+                    else:
+                        values = row
 
-                # Determine which cells to check for URLs
-                if column_index_url >= 0:
-                    # Check only the specified column
-                    cells_to_check = [row[column_index_url]] if column_index_url < len(row) else []
-                else:
-                    # Check all cells
-                    cells_to_check = row
+                    custom_name = ""
+                    if column_index_name is not None and column_index_name < len(values):
+                        cell_value = values[column_index_name]
+                        custom_name = str(cell_value).strip() if cell_value else ""
 
-                for cell in cells_to_check:
-                    if cell.value:
-                        found_urls = []
-                        # Check if cell has a hyperlink
-                        if cell.hyperlink and cell.hyperlink.target:
-                            found_urls.append(cell.hyperlink.target)
+                    # Determine which cells to check for URLs
+                    if column_index_url >= 0:
+                        # Check only the specified column
+                        indexes_to_check = [column_index_url] if column_index_url < len(values) else []
+                    else:
+                        # Check all cells
+                        indexes_to_check = range(len(values))
 
-                        # Also check cell value for URLs
-                        found_urls.extend(extract_urls_from_text(str(cell.value)))
+                    for index in indexes_to_check:
+                        value = values[index]
+                        if value:
+                            found_urls = []
+                            # Check if cell has a hyperlink
+                            if scan_hyperlinks:
+                                hyperlink = row[index].hyperlink
+                                if hyperlink and hyperlink.target:
+                                    found_urls.append(hyperlink.target)
 
-                        for url in found_urls:
-                            url_data.append((url, custom_name))
+                            # Also check cell value for URLs
+                            found_urls.extend(extract_urls_from_text(value))
 
-        workbook.close()
+                            for url in found_urls:
+                                if url not in seen:
+                                    seen.add(url)
+                                    url_data.append((url, custom_name))
+        finally:
+            workbook.close()
     except Exception as e:
         print(f"Error reading XLSX file {file_path}: {str(e)}")
 
     return url_data
 
 
-def read_xls_file(file_path: Path, column_index_name: int = None, column_index_url: int = -1) -> List[Tuple[str, str]]:
+def read_xls_file(file_path: Path, column_index_name: int = None, column_index_url: int = -1,
+                  seen: Optional[Set[str]] = None) -> List[Tuple[str, str]]:
     """
     Read XLS file and extract all URLs from cells.
 
@@ -247,65 +714,62 @@ def read_xls_file(file_path: Path, column_index_name: int = None, column_index_u
         file_path: Path to XLS file
         column_index_name: Optional column index for custom filename (0-based)
         column_index_url: Column index where URLs are located (0-based). If -1, check all cells.
+        seen: Optional set of already collected URLs, shared between calls. URLs in it are
+              skipped and new ones are added to it.
 
     Returns:
-        List of tuples (URL, custom_filename) found in the file
+        List of tuples (URL, custom_filename) found in the file, without duplicate URLs
     """
     if not XLRD_AVAILABLE:
         print("Error: xlrd library is not installed. Install it with: pip install xlrd")
         return []
 
     url_data = []
+    if seen is None:
+        seen = set()
 
     try:
         workbook = xlrd.open_workbook(file_path)
 
         # Iterate through all sheets
-        for sheet_index in range(workbook.nsheets):
-            sheet = workbook.sheet_by_index(sheet_index)
+        for sheet in workbook.sheets():
+            # Hyperlinks by (row, column), collected in the same pass as cell values
+            hyperlink_map = getattr(sheet, 'hyperlink_map', {})
 
             # Iterate through all rows
             for row_index in range(sheet.nrows):
+                values = sheet.row_values(row_index)
+
                 custom_name = ""
-                if column_index_name is not None and column_index_name < sheet.ncols:
-                    cell_value = sheet.cell(row_index, column_index_name).value
+                if column_index_name is not None and column_index_name < len(values):
+                    cell_value = values[column_index_name]
                     custom_name = str(cell_value).strip() if cell_value else ""
 
                 # Determine which columns to check for URLs
                 if column_index_url >= 0:
                     # Check only the specified column
-                    cols_to_check = [column_index_url] if column_index_url < sheet.ncols else []
+                    cols_to_check = [column_index_url] if column_index_url < len(values) else []
                 else:
                     # Check all columns
-                    cols_to_check = range(sheet.ncols)
+                    cols_to_check = range(len(values))
 
                 for col_index in cols_to_check:
-                    cell = sheet.cell(row_index, col_index)
-                    if cell.value:
-                        found_urls = extract_urls_from_text(str(cell.value))
-                        for url in found_urls:
-                            url_data.append((url, custom_name))
+                    found_urls = []
 
-        # Also check for hyperlinks
-        try:
-            for sheet_index in range(workbook.nsheets):
-                sheet = workbook.sheet_by_index(sheet_index)
-                if hasattr(sheet, 'hyperlink_map'):
-                    for row_index, link in sheet.hyperlink_map.items():
-                        if link.url_or_path:
-                            # If column_index_url is specified, skip hyperlinks not in that column
-                            if column_index_url >= 0:
-                                # We can't easily determine which column a hyperlink is in from xlrd
-                                # So we skip hyperlink processing when column_index_url is specified
-                                continue
+                    # Check if cell has a hyperlink
+                    link = hyperlink_map.get((row_index, col_index)) if hyperlink_map else None
+                    if link is not None and link.url_or_path and link.url_or_path.startswith(('http://', 'https://')):
+                        found_urls.append(link.url_or_path)
 
-                            custom_name = ""
-                            if column_index_name is not None and column_index_name < sheet.ncols:
-                                cell_value = sheet.cell(row_index, column_index_name).value
-                                custom_name = str(cell_value).strip() if cell_value else ""
-                            url_data.append((link.url_or_path, custom_name))
-        except:
-            pass  # Hyperlinks not available in this version
+                    # Also check cell value for URLs
+                    value = values[col_index]
+                    if value:
+                        found_urls.extend(extract_urls_from_text(value))
+
+                    for url in found_urls:
+                        if url not in seen:
+                            seen.add(url)
+                            url_data.append((url, custom_name))
 
     except Exception as e:
         print(f"Error reading XLS file {file_path}: {str(e)}")
@@ -313,7 +777,8 @@ def read_xls_file(file_path: Path, column_index_name: int = None, column_index_u
     return url_data
 
 
-def read_file(file_path: Path, column_index_name: int = None, column_index_url: int = -1) -> List[Tuple[str, str]]:
+def read_file(file_path: Path, column_index_name: int = None, column_index_url: int = -1,
+              scan_hyperlinks: bool = True) -> List[Tuple[str, str]]:
     """
     Read file and extract URLs based on file extension.
 
@@ -321,18 +786,21 @@ def read_file(file_path: Path, column_index_name: int = None, column_index_url:
         file_path: Path to the file
         column_index_name: Optional column index for custom filename (0-based)
         column_index_url: Column index where URLs are located (0-based). If -1, check all cells.
+        scan_hyperlinks: Also extract hyperlink targets from XLSX cells
 
     Returns:
-        List of tuples (URL, custom_filename) found in the file
+        List of tuples (URL, custom_filename) found in the file, each URL listed once
+        (with the filename from its first occurrence)
     """
     suffix = file_path.suffix.lower()
+    seen = set()
 
     if suffix == '.csv':
-        return read_csv_file(file_path, column_index_name, column_index_url)
+        return read_csv_file(file_path, column_index_name, column_index_url, seen)
     elif suffix == '.xlsx':
-        return read_xlsx_file(file_path, column_index_name, column_index_url)
+        return read_xlsx_file(file_path, column_index_name, column_index_url, scan_hyperlinks, seen)
     elif suffix == '.xls':
-        return read_xls_file(file_path, column_index_name, column_index_url)
+        return read_xls_file(file_path, column_index_name, column_index_url, seen)
     else:
         print(f"Error: Unsupported file format '{suffix}'. Supported formats: .xls, .xlsx, .csv")
         return []
@@ -348,6 +816,8 @@ Examples:
   python download.py data.xlsx /path/to/output
   python download.py data.csv ~/Downloads
   python download.py data.xls ./files
+  python download.py data.csv ./files --workers 16
+  python download.py data.xlsx ./files --no-hyperlinks
         """
     )
 
@@ -377,8 +847,26 @@ Examples:
         help="Column index (0-based) where URLs are located. If -1 (default), check all cells for URLs"
     )
 
+    parser.add_argument(
+        "--no-hyperlinks",
+        dest="scan_hyperlinks",
+        action="store_false",
+        help="Ignore hyperlink targets in XLSX cells and only scan cell text (faster with --column-index-name)"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_DOWNLOAD_WORKERS,
+        help=f"Number of files downloaded in parallel (1-{MAX_DOWNLOAD_WORKERS}, default: {DEFAULT_DOWNLOAD_WORKERS})"
+    )
+
     args = parser.parse_args()
 
+    if not 1 <= args.workers <= MAX_DOWNLOAD_WORKERS:
+        print(f"Error: --workers must be between 1 and {MAX_DOWNLOAD_WORKERS}.")
+        sys.exit(1)
+
     # Convert paths to Path objects
     file_path = Path(args.file).resolve()
     folder_path = Path(args.folder).resolve()
@@ -398,15 +886,8 @@ Examples:
 
     # Read file and extract URLs with custom filenames
     print(f"Reading file: {file_path}")
-    url_data = read_file(file_path, args.column_index_name, args.column_index_url)
-
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_url_data = []
-    for url, custom_name in url_data:
-        if url not in seen:
-            seen.add(url)
-            unique_url_data.append((url, custom_name))
+    # URLs are deduplicated while reading, keeping the first occurrence
+    unique_url_data = read_file(file_path, args.column_index_name, args.column_index_url, args.scan_hyperlinks)
 
     if not unique_url_data:
         print("No URLs found in the file.")
@@ -420,40 +901,45 @@ Examples:
     skipped = 0
     renamed = 0
 
+    # Resolve target names and handle existing files first, then fetch the
+    # remaining URLs concurrently (downloads are I/O bound)
+    pending = []
+
+    queued = set()
+    folder_str = str(folder_path)
+
+    # Names already in the output folder, read with one directory scan
+    # instead of a stat() per URL
+    with os.scandir(folder_path) as entries:
+        existing = {os.path.normcase(entry.name) for entry in entries}
+
     for i, (url, custom_name) in enumerate(unique_url_data, 1):
         print(f"\n[{i}/{len(unique_url_data)}] Processing: {url}")
 
         # Get filename from URL
         original_filename = get_filename_from_url(url)
-        original_path = folder_path / original_filename
-
-        # Determine final filename
-        final_filename = original_filename
-        final_path = original_path
-
-        if custom_name:
-            # Preserve file extension from original filename
-            original_ext = Path(original_filename).suffix
-            # If custom_name already has extension, use it as is, otherwise add original extension
-            if Path(custom_name).suffix:
-                final_filename = custom_name
-            else:
-                final_filename = custom_name + original_ext
-            final_path = folder_path / final_filename
+        original_path = os.path.join(folder_str, original_filename)
+
+        # Determine final filename (custom name keeps the original extension)
+        final_filename = get_target_filename(original_filename, custom_name)
+        final_path = os.path.join(folder_str, final_filename) if custom_name else original_path
 
-        # Check if final file already exists
-        if final_path.exists():
+        # Check if final file already exists (or is already queued for download)
+        final_key = os.path.normcase(final_filename)
+        if final_key in existing or final_key in queued:
             print(f"Skipped (already exists): {final_filename}")
             skipped += 1
             continue
 
         # Check if original file already exists
-        if original_path.exists() and original_path != final_path:
+        if final_path != original_path and os.path.normcase(original_filename) in existing:
             # File with original name exists, and we have a custom name
             if custom_name:
                 # Rename the existing file
                 try:
-                    original_path.rename(final_path)
+                    os.rename(original_path, final_path)
+                    existing.discard(os.path.normcase(original_filename))
+                    existing.add(final_key)
                     print(f"Renamed existing file: {original_filename} -> {final_filename}")
                     renamed += 1
                     skipped += 1
@@ -468,21 +954,31 @@ Examples:
                 skipped += 1
                 continue
 
-        # Download the file to original path first
-        if download_file(url, original_path):
-            # If we have a custom name and it's different from original, rename
-            if custom_name and final_path != original_path:
-                try:
-                    original_path.rename(final_path)
-                    print(f"Downloaded and renamed: {final_filename}")
-                    renamed += 1
-                except Exception as e:
-                    print(f"Downloaded as {original_filename}, but failed to rename: {str(e)}")
-            else:
-                print(f"Downloaded: {original_filename}")
-            successful += 1
-        else:
-            failed += 1
+        # Download straight to the final path so concurrent downloads never
+        # share a temporary file name
+        queued.add(final_key)
+        pending.append((url, original_filename, final_filename, final_path))
+
+    if pending:
+        print(f"\nDownloading {len(pending)} file(s)...")
+
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            futures = {
+                executor.submit(download_file, url, final_path): (original_filename, final_filename)
+                for url, original_filename, final_filename, final_path in pending
+            }
+
+            for future in as_completed(futures):
+                original_filename, final_filename = futures[future]
+                if future.result():
+                    if final_filename != original_filename:
+                        print(f"Downloaded and renamed: {final_filename}")
+                        renamed += 1
+                    else:
+                        print(f"Downloaded: {original_filename}")
+                    successful += 1
+                else:
+                    failed += 1
 
     # Print summary
     print("\n" + "=" * 50)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Helpers for creating and listing test fixture files.
+Files with content are packed into an in-memory tar archive and extracted in
+one call, instead of opening, writing and closing every file separately.
+Empty files are only opened with O_CREAT and closed, skipping the utime call
+that Path.touch and tar extraction make for every file.
+"""
+
+import io
+import os
+import tarfile
+from pathlib import Path
+from typing import Dict, Iterable, Set, Union
+
+
+def create_files(folder: Path, files: Union[Iterable[str], Dict[str, str]]) -> None:
+    """
+    Create test files in a folder.
+
+    Args:
+        folder: Folder where to create the files
+        files: File names (created empty) or a mapping of file name to text content
+    """
+    if not isinstance(files, dict):
+        for name in files:
+            os.close(os.open(os.path.join(folder, name), os.O_CREAT | os.O_WRONLY, 0o644))
+        return
+
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w') as tar:
+        for name, content in files.items():
+            data = content.encode('utf-8')
+            info = tarfile.TarInfo(name=name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+    buffer.seek(0)
+    with tarfile.open(fileobj=buffer, mode='r') as tar:
+        if hasattr(tarfile, 'data_filter'):
+            tar.extractall(path=folder, filter='data')
+        else:
+            tar.extractall(path=folder)
+
+
+def file_names(folder: Path) -> Set[str]:
+    """
+    Get the names of the files in a folder with one directory scan.
+
+    Args:
+        folder: Folder to list
+
+    Returns:
+        Set of file names (subdirectories are skipped)
+    """
+    with os.scandir(folder) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
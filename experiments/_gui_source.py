@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Shared access to the gui.py source for the code verification test scripts.
+The file is read once per process, no matter how many checks use it.
+"""
+
+import ast
+import functools
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Set
+
+GUI_FILE = Path(__file__).parent.parent / "gui.py"
+
+
+@functools.lru_cache(maxsize=1)
+def gui_source() -> str:
+    """
+    Get the source code of gui.py.
+
+    Returns:
+        Content of gui.py
+    """
+    return GUI_FILE.read_text(encoding='utf-8')
+
+
+@functools.lru_cache(maxsize=1)
+def gui_lines() -> List[str]:
+    """
+    Get the source code of gui.py split into lines.
+
+    Returns:
+        List of lines of gui.py
+    """
+    return gui_source().splitlines()
+
+
+@functools.lru_cache(maxsize=1)
+def gui_ast() -> ast.Module:
+    """
+    Get the parsed syntax tree of gui.py.
+
+    Returns:
+        AST module of gui.py
+    """
+    return ast.parse(gui_source(), filename=str(GUI_FILE))
+
+
+@functools.lru_cache(maxsize=1)
+def gui_methods() -> Dict[str, Dict[str, ast.FunctionDef]]:
+    """
+    Index the methods of all top-level classes in gui.py.
+
+    Returns:
+        Mapping of class name to a mapping of method name to its definition
+    """
+    return {
+        node.name: {
+            item.name: item for item in node.body if isinstance(item, ast.FunctionDef)
+        }
+        for node in gui_ast().body
+        if isinstance(node, ast.ClassDef)
+    }
+
+
+def find_markers(markers: Iterable[str]) -> Set[str]:
+    """
+    Find which of the given strings occur in gui.py with one scan of the source.
+
+    All markers are combined into a single regex alternation inside a lookahead,
+    so a match is tried at every position without consuming text. Markers that
+    only occur inside a longer marker starting at the same position are not
+    reported by that pass, so anything left unmatched is checked with a plain
+    substring test.
+
+    Args:
+        markers: Strings to look for
+
+    Returns:
+        Set of markers found in gui.py
+    """
+    markers = sorted(set(markers), key=len, reverse=True)
+    if not markers:
+        return set()
+
+    content = gui_source()
+    pattern = re.compile('(?=(' + '|'.join(map(re.escape, markers)) + '))')
+    found = {match.group(1) for match in pattern.finditer(content)}
+    found.update(marker for marker in markers if marker not in found and marker in content)
+    return found
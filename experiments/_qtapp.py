@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Shared Qt application instance for the GUI test scripts.
+Creating a Qt application initializes the platform plugin and event loop,
+so tests reuse one instance per process instead of creating a new one each time.
+"""
+
+import sys
+
+from PyQt6.QtCore import QCoreApplication
+
+
+def qt_app(widgets: bool = True) -> QCoreApplication:
+    """
+    Get the running Qt application, creating it on first use.
+
+    Args:
+        widgets: Create a QApplication (needed for widgets) rather than a
+                 QCoreApplication (enough for QThread workers)
+
+    Returns:
+        Qt application instance
+    """
+    app = QCoreApplication.instance()
+    if app is None:
+        if widgets:
+            from PyQt6.QtWidgets import QApplication
+            app = QApplication(sys.argv)
+        else:
+            app = QCoreApplication(sys.argv)
+    return app
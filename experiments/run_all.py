@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Run the experiment test scripts in parallel.
+Every script runs in its own Python process (so each GUI test gets its own Qt
+application) and the results are collected into one summary.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Tuple
+
+EXPERIMENTS_DIR = Path(__file__).parent
+
+# Scripts that open a window and wait for the user, so they never finish on their own
+INTERACTIVE_TESTS = {"test_language_switching.py"}
+
+
+def run_test(script: str, timeout: float) -> Tuple[str, int, float, str]:
+    """
+    Run one test script in a separate Python process.
+
+    Args:
+        script: File name of the test script in the experiments folder
+        timeout: Maximum run time in seconds
+
+    Returns:
+        Tuple of (script, return code, duration in seconds, combined output).
+        The return code is -1 if the script timed out.
+    """
+    start = time.monotonic()
+    try:
+        result = subprocess.run(
+            [sys.executable, str(EXPERIMENTS_DIR / script)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            timeout=timeout
+        )
+        return script, result.returncode, time.monotonic() - start, result.stdout
+    except subprocess.TimeoutExpired as e:
+        output = e.stdout.decode(errors='replace') if isinstance(e.stdout, bytes) else (e.stdout or "")
+        return script, -1, time.monotonic() - start, output + f"\nTimed out after {timeout:g}s"
+
+
+def main():
+    """Main function to run all test scripts."""
+    parser = argparse.ArgumentParser(
+        description="Run experiment test scripts in parallel",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python experiments/run_all.py
+  python experiments/run_all.py test_rename.py test_zero_num.py
+  python experiments/run_all.py --workers 2 --verbose
+        """
+    )
+
+    parser.add_argument(
+        "tests",
+        nargs="*",
+        help="Test scripts to run (default: all test_*.py except interactive ones)"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of scripts run at the same time (default: number of CPUs)"
+    )
+
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=300,
+        help="Maximum run time of one script in seconds (default: 300)"
+    )
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print the output of passed scripts too (output of failed scripts is always printed)"
+    )
+
+    args = parser.parse_args()
+
+    if args.workers < 1:
+        print("Error: --workers must be at least 1.")
+        sys.exit(1)
+
+    if args.tests:
+        tests = [Path(test).name for test in args.tests]
+    else:
+        tests = sorted(
+            path.name for path in EXPERIMENTS_DIR.glob("test_*.py")
+            if path.name not in INTERACTIVE_TESTS
+        )
+
+    print(f"Running {len(tests)} test script(s) with {args.workers} worker(s)...")
+
+    failed = []
+    start = time.monotonic()
+
+    # Every script already runs in its own process, so threads that wait for
+    # them are enough (subprocess.run releases the GIL while it waits)
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(run_test, test, args.timeout) for test in tests]
+
+        for future in as_completed(futures):
+            script, returncode, duration, output = future.result()
+            passed = returncode == 0
+            print(f"{'✓' if passed else '✗'} {script} ({duration:.1f}s)")
+
+            if not passed:
+                failed.append(script)
+            if not passed or args.verbose:
+                print(output.rstrip())
+                print("-" * 60)
+
+    # Print summary
+    print("\n" + "=" * 60)
+    print(f"Passed: {len(tests) - len(failed)}/{len(tests)} in {time.monotonic() - start:.1f}s")
+    if failed:
+        print(f"Failed: {', '.join(sorted(failed))}")
+    print("=" * 60)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -130,6 +130,10 @@ def test_xlsx_with_column_index_url():
     sheet['B3'] = 'http://example.com/files/another.png'
     sheet['C3'] = 'See http://example.com/wrong2.png'
 
+    sheet['A4'] = 'image3'
+    sheet['B4'] = 'Link text'
+    sheet['B4'].hyperlink = 'http://example.com/files/linked.gif'
+
     workbook.save(xlsx_path)
 
     try:
@@ -148,12 +152,33 @@ def test_xlsx_with_column_index_url():
         print(f"Found {len(url_data)} URLs:")
         for url, custom_name in url_data:
             print(f"  URL: {url}")
-        expected_count = 2  # Only URLs from column B
+        expected_count = 3  # URLs from column B, including the hyperlink target
         assert len(url_data) == expected_count, f"Expected {expected_count} URLs, got {len(url_data)}"
         assert 'photo.jpg' in url_data[0][0], "Should find photo.jpg"
         assert 'another.png' in url_data[1][0], "Should find another.png"
+        assert 'linked.gif' in url_data[2][0], "Should find hyperlink target linked.gif"
         print("✓ Test 2 passed")
 
+        # Test 3: Hyperlinks are skipped with scan_hyperlinks=False
+        print("\nTest 3: With --no-hyperlinks (cell text only)")
+        url_data = read_xlsx_file(xlsx_path, None, 1, scan_hyperlinks=False)
+        print(f"Found {len(url_data)} URLs:")
+        for url, custom_name in url_data:
+            print(f"  URL: {url}")
+        assert len(url_data) == 2, f"Expected 2 URLs, got {len(url_data)}"
+        assert all('linked.gif' not in url for url, _ in url_data), "Should not find hyperlink target"
+        print("✓ Test 3 passed")
+
+        # Test 4: Hyperlinks are also collected with a name column (openpyxl path)
+        print("\nTest 4: With --column-index-name=0 (hyperlink with custom name)")
+        url_data = read_xlsx_file(xlsx_path, 0, 1)
+        print(f"Found {len(url_data)} URLs:")
+        for url, custom_name in url_data:
+            print(f"  URL: {url} -> {custom_name}")
+        assert len(url_data) == 3, f"Expected 3 URLs, got {len(url_data)}"
+        assert url_data[2] == ('http://example.com/files/linked.gif', 'image3'), "Should name linked.gif image3"
+        print("✓ Test 4 passed")
+
         print("\n" + "=" * 60)
         print("All XLSX tests passed! ✓")
         print("=" * 60)
@@ -9,25 +9,28 @@ from pathlib import Path
 # Add parent directory to path to import download module
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from download import read_csv_file, get_filename_from_url
+from download import read_csv_file, get_filename_from_url, get_target_filename
 
 
 def test_csv_reading_with_column_index():
     """Test reading CSV with column index for custom filename."""
     print("Testing CSV reading with column index...")
 
-    # Create a temporary CSV file with test data
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as f:
-        csv_path = Path(f.name)
-        writer = csv.writer(f)
+    # Create a temporary CSV file with test data (removed together with its folder)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_path = Path(temp_dir) / "urls.csv"
 
-        # Write test data: column 0 = custom name, column 1 = URL
-        writer.writerow(['image1', 'http://example.com/files/photo.jpg'])
-        writer.writerow(['image2', 'http://example.com/files/another.png'])
-        writer.writerow(['', 'http://example.com/files/noname.gif'])  # Empty custom name
-        writer.writerow(['document1', 'http://example.com/docs/file.pdf'])
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.writer(f, dialect='unix')
+
+            # Write test data: column 0 = custom name, column 1 = URL
+            writer.writerows([
+                ['image1', 'http://example.com/files/photo.jpg'],
+                ['image2', 'http://example.com/files/another.png'],
+                ['', 'http://example.com/files/noname.gif'],  # Empty custom name
+                ['document1', 'http://example.com/docs/file.pdf'],
+            ])
 
-    try:
         # Test 1: Read without column index
         print("\nTest 1: Without column index")
         url_data = read_csv_file(csv_path, None)
@@ -45,9 +48,6 @@ def test_csv_reading_with_column_index():
         print("\n✓ CSV reading tests passed!")
         return True
 
-    finally:
-        csv_path.unlink()
-
 
 def test_filename_logic():
     """Test filename determination logic."""
@@ -60,22 +60,24 @@ def test_filename_logic():
 
     # Test 1: No custom name
     custom_name = ""
-    final_filename = original_filename
+    final_filename = get_target_filename(original_filename, custom_name)
     print(f"\nTest 1: No custom name")
     print(f"  Final filename: {final_filename}")
+    assert final_filename == "photo.jpg", f"Expected 'photo.jpg', got '{final_filename}'"
 
     # Test 2: Custom name without extension
     custom_name = "image1"
-    original_ext = Path(original_filename).suffix
-    final_filename = custom_name + original_ext if not Path(custom_name).suffix else custom_name
+    final_filename = get_target_filename(original_filename, custom_name)
     print(f"\nTest 2: Custom name without extension: '{custom_name}'")
     print(f"  Final filename: {final_filename}")
+    assert final_filename == "image1.jpg", f"Expected 'image1.jpg', got '{final_filename}'"
 
     # Test 3: Custom name with extension
     custom_name = "image2.png"
-    final_filename = custom_name if Path(custom_name).suffix else custom_name + original_ext
+    final_filename = get_target_filename(original_filename, custom_name)
     print(f"\nTest 3: Custom name with extension: '{custom_name}'")
     print(f"  Final filename: {final_filename}")
+    assert final_filename == "image2.png", f"Expected 'image2.png', got '{final_filename}'"
 
     print("\n✓ Filename logic tests passed!")
     return True
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test resuming interrupted downloads from .part files.
+A local HTTP server answers Range requests and honours If-Range, so a partial
+file is only continued while the resource on the server is unchanged.
+"""
+
+import os
+import re
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add parent directory to path to import download module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from download import download_file, PARTIAL_DOWNLOAD_SUFFIX, PARTIAL_VALIDATOR_SUFFIX
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Serve the server's current content with ETag, Range and If-Range support."""
+
+    def do_GET(self):
+        content = self.server.content
+        etag = self.server.etag
+        self.server.requests.append(dict(self.headers))
+
+        start = 0
+        match = re.match(r'bytes=(\d+)-', self.headers.get('Range', ''))
+        if match and self.headers.get('If-Range') in (None, etag):
+            start = int(match.group(1)) + self.server.range_shift
+
+        if start:
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{len(content) - 1}/{len(content)}')
+        else:
+            self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(content) - start))
+        self.end_headers()
+        self.wfile.write(content[start:])
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(content: bytes, etag: str) -> ThreadingHTTPServer:
+    """Start the test server in a background thread."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), RangeHandler)
+    server.content = content
+    server.etag = etag
+    server.range_shift = 0  # Makes 206 responses start at the wrong offset
+    server.requests = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_download_resume():
+    """Test resuming, restarting on a changed resource and rejecting a wrong range."""
+    print("=" * 60)
+    print("Testing download resume")
+    print("=" * 60)
+
+    content = bytes(range(256)) * 64
+    server = start_server(content, '"v1"')
+    url = f"http://127.0.0.1:{server.server_port}/file.bin"
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, 'file.bin')
+            part_path = output_path + PARTIAL_DOWNLOAD_SUFFIX
+            validator_path = part_path + PARTIAL_VALIDATOR_SUFFIX
+
+            # Test 1: A fresh download leaves no partial or validator file
+            print("\nTest 1: Fresh download")
+            assert download_file(url, output_path), "Download should succeed"
+            assert Path(output_path).read_bytes() == content, "Content should match"
+            assert not os.path.exists(part_path) and not os.path.exists(validator_path)
+            print("✓ Test 1 passed")
+
+            # Test 2: A partial file with a matching validator is continued
+            print("\nTest 2: Resume unchanged resource")
+            os.remove(output_path)
+            Path(part_path).write_bytes(content[:1000])
+            Path(validator_path).write_text('"v1"', encoding='utf-8')
+            assert download_file(url, output_path), "Download should succeed"
+            assert server.requests[-1].get('Range') == 'bytes=1000-', "Should request the rest"
+            assert server.requests[-1].get('If-Range') == '"v1"', "Should send the validator"
+            assert Path(output_path).read_bytes() == content, "Resumed content should match"
+            print("✓ Test 2 passed")
+
+            # Test 3: The resource changed, so the server sends all of it again
+            print("\nTest 3: Resume changed resource")
+            os.remove(output_path)
+            server.content = content[::-1]
+            server.etag = '"v2"'
+            Path(part_path).write_bytes(content[:1000])
+            Path(validator_path).write_text('"v1"', encoding='utf-8')
+            assert download_file(url, output_path), "Download should succeed"
+            assert Path(output_path).read_bytes() == server.content, "Stale part should be replaced"
+            print("✓ Test 3 passed")
+
+            # Test 4: A partial file without a validator is not resumed
+            print("\nTest 4: Partial file without validator")
+            os.remove(output_path)
+            Path(part_path).write_bytes(b'stale data')
+            assert download_file(url, output_path), "Download should succeed"
+            assert 'Range' not in server.requests[-1], "Should not request a range"
+            assert Path(output_path).read_bytes() == server.content, "Content should match"
+            print("✓ Test 4 passed")
+
+            # Test 5: A 206 response that doesn't start at the partial size is rejected
+            print("\nTest 5: Wrong Content-Range start")
+            os.remove(output_path)
+            server.range_shift = 10
+            Path(part_path).write_bytes(server.content[:1000])
+            Path(validator_path).write_text('"v2"', encoding='utf-8')
+            assert download_file(url, output_path), "Download should succeed"
+            assert Path(output_path).read_bytes() == server.content, "Content should not be corrupted"
+            print("✓ Test 5 passed")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print("\n" + "=" * 60)
+    print("All download resume tests passed! ✓")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    test_download_resume()
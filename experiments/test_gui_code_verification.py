@@ -4,48 +4,40 @@ Test script to verify that the gui.py file contains the numbers_only_at_end opti
 This test reads the source code directly to verify the changes.
 """
 
+import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _gui_source import find_markers, gui_source
+
 
 def test_gui_source_contains_numbers_only_at_end():
     """Test that the gui.py source contains the numbers_only_at_end option."""
-    gui_file = Path(__file__).parent.parent / "gui.py"
-
-    with open(gui_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = gui_source()
+    found = find_markers(['numbers_only_at_end', 'Только число в конце имени'])
 
     # Check that numbers_only_at_end is present
-    assert 'numbers_only_at_end' in content, "numbers_only_at_end not found in gui.py"
+    assert 'numbers_only_at_end' in found, "numbers_only_at_end not found in gui.py"
     print("✓ Found 'numbers_only_at_end' in gui.py")
 
     # Check that the Russian text is present (the display text for the option)
-    assert 'Только число в конце имени' in content, "Display text not found in gui.py"
+    assert 'Только число в конце имени' in found, "Display text not found in gui.py"
     print("✓ Found display text 'Только число в конце имени' in gui.py")
 
     # Count how many times addItem appears for rename_type_combo
     # Should be 4 (sequential, numbers_only, text_only, numbers_only_at_end)
-    lines = content.split('\n')
-    add_item_count = 0
-    in_rename_section = False
-
-    for line in lines:
-        if 'self.rename_type_combo = QComboBox()' in line:
-            in_rename_section = True
-        elif in_rename_section:
-            if 'self.rename_type_combo.addItem' in line:
-                add_item_count += 1
-            elif 'rename_type_layout.addWidget(self.rename_type_combo)' in line:
-                break
+    start = content.index('self.rename_type_combo = QComboBox()')
+    end = content.index('rename_type_layout.addWidget(self.rename_type_combo)', start)
+    add_item_count = content.count('self.rename_type_combo.addItem', start, end)
 
     assert add_item_count == 4, f"Expected 4 addItem calls, got {add_item_count}"
     print(f"✓ Found {add_item_count} rename type options in gui.py")
 
     # Extract and display all rename options
-    print("\nRename type options found in gui.py:")
-    for i, line in enumerate(lines):
-        if 'self.rename_type_combo.addItem' in line:
-            print(f"  {line.strip()}")
+    matches = re.findall(r'[^\n]*self\.rename_type_combo\.addItem[^\n]*', content)
+    sys.stdout.write("\nRename type options found in gui.py:\n" + "".join(f"  {line.strip()}\n" for line in matches))
 
     print("\n✓ All tests passed! The GUI code correctly includes the numbers_only_at_end option.")
 
@@ -9,14 +9,15 @@ from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
 
-from PyQt6.QtWidgets import QApplication
+from _qtapp import qt_app
 from gui import MainWindow
 
 
 def test_numbers_only_at_end_option():
     """Test that numbers_only_at_end option is available in GUI."""
-    app = QApplication(sys.argv)
+    app = qt_app()  # keep a reference, the window needs a live application
     window = MainWindow()
 
     # Get the rename type combobox
@@ -46,9 +47,6 @@ def test_numbers_only_at_end_option():
 
     print("\n✓ All tests passed! The numbers_only_at_end option is correctly added to the GUI.")
 
-    # Don't show the window, just test
-    app.quit()
-
 
 if __name__ == "__main__":
     test_numbers_only_at_end_option()
@@ -10,8 +10,12 @@ from pathlib import Path
 
 # Add parent directory to path to import gui module
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
 
-from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtCore import QEventLoop
+
+from _fixtures import create_files, file_names
+from _qtapp import qt_app
 from gui import FileRenamerThread
 
 
@@ -21,8 +25,8 @@ def test_file_renamer_thread():
     print("Testing FileRenamerThread")
     print("=" * 60)
 
-    # Create QCoreApplication (required for QThread)
-    app = QCoreApplication(sys.argv)
+    # Qt application (required for QThread event delivery)
+    app = qt_app(widgets=False)  # noqa: F841 - must stay alive while the threads run
 
     # Create a temporary directory with test files
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -38,59 +42,68 @@ def test_file_renamer_thread():
         ]
 
         print(f"\nCreating test files in: {temp_path}")
+        create_files(temp_path, {filename: f"Content: {filename}" for filename in test_files})
         for filename in test_files:
-            (temp_path / filename).write_text(f"Content: {filename}")
             print(f"  Created: {filename}")
 
+        # Both tests share this directory: Test 2 renames the files Test 1 left untouched
+        original_names = frozenset(test_files)
+
         # Test 1: Dry run with sequential renaming
         print("\n" + "-" * 60)
         print("Test 1: Sequential renaming (dry run)")
         print("-" * 60)
 
-        test_passed = [False]  # Use list to allow modification in nested function
+        # One event loop is reused to wait for both threads
+        loop = QEventLoop()
 
-        def on_log(message):
-            print(f"LOG: {message}")
+        def on_log(messages):
+            for message in messages:
+                print(f"LOG: {message}")
 
         def on_progress(value):
             print(f"PROGRESS: {value}%")
 
-        def on_finished(stats):
-            print(f"\nFINISHED: {stats}")
-            test_passed[0] = True
-            app.quit()
+        def run_thread(thread):
+            """Run a renamer thread until it finishes and return its statistics."""
+            stats = {}
+
+            def on_finished(result):
+                print(f"\nFINISHED: {result}")
+                stats.update(result)
+                loop.quit()
 
-        thread = FileRenamerThread(
+            thread.log.connect(on_log)
+            thread.progress.connect(on_progress)
+            thread.finished.connect(on_finished)
+
+            thread.start()
+            loop.exec()
+            thread.wait()
+            return stats
+
+        stats = run_thread(FileRenamerThread(
             temp_path,
             sort_type='name',
             rename_type='sequential',
             prefix='img_',
             suffix='',
             dry_run=True
-        )
-
-        thread.log.connect(on_log)
-        thread.progress.connect(on_progress)
-        thread.finished.connect(on_finished)
+        ))
 
-        thread.start()
-        app.exec()
-
-        if test_passed[0]:
+        if stats:
             print("\n✓ Test 1 passed: Dry run completed successfully")
         else:
             print("\n✗ Test 1 failed: Dry run did not complete")
             return False
 
         # Verify files were NOT renamed (dry run)
-        files_after_dry_run = list(temp_path.iterdir())
-        original_names = {f.name for f in files_after_dry_run}
-        expected_original = {'photo_001.jpg', 'photo_002.jpg', 'photo_003.jpg', 'image100text.png', 'document25.txt'}
+        current_names = file_names(temp_path)
 
-        if original_names == expected_original:
+        if current_names == original_names:
             print("✓ Files were not modified (dry run worked correctly)")
         else:
-            print(f"✗ Files were modified during dry run! Found: {original_names}")
+            print(f"✗ Files were modified during dry run! Found: {current_names}")
             return False
 
         # Test 2: Actual renaming
@@ -98,45 +111,31 @@ def test_file_renamer_thread():
         print("Test 2: Sequential renaming (actual)")
         print("-" * 60)
 
-        # Create new app for second test
-        app2 = QCoreApplication(sys.argv)
-        test_passed[0] = False
-
-        def on_finished2(stats):
-            print(f"\nFINISHED: {stats}")
-            test_passed[0] = stats['successful'] == 5 and stats['failed'] == 0
-            app2.quit()
-
-        thread2 = FileRenamerThread(
+        stats = run_thread(FileRenamerThread(
             temp_path,
             sort_type='name',
             rename_type='sequential',
             prefix='img_',
             suffix='_final',
             dry_run=False
-        )
-
-        thread2.log.connect(on_log)
-        thread2.progress.connect(on_progress)
-        thread2.finished.connect(on_finished2)
-
-        thread2.start()
-        app2.exec()
+        ))
 
-        if test_passed[0]:
+        if stats.get('successful') == 5 and stats.get('failed') == 0:
             print("\n✓ Test 2 passed: Actual renaming completed successfully")
         else:
             print("\n✗ Test 2 failed: Renaming did not complete successfully")
             return False
 
         # Verify files were renamed
-        files_after_rename = list(temp_path.iterdir())
-        renamed_names = {f.name for f in files_after_rename}
+        renamed_names = file_names(temp_path)
 
         print(f"\nFiles after renaming: {sorted(renamed_names)}")
 
-        # Files should be renamed in alphabetical order: document25.txt, image100text.png, photo_001.jpg, photo_002.jpg, photo_003.jpg
-        expected_renamed = {'img_1_final.txt', 'img_2_final.png', 'img_3_final.jpg', 'img_4_final.jpg', 'img_5_final.jpg'}
+        # Files are numbered in alphabetical order and keep their extensions
+        expected_renamed = {
+            f'img_{i}_final{Path(name).suffix}'
+            for i, name in enumerate(sorted(original_names), 1)
+        }
         if renamed_names == expected_renamed:
             print("✓ Files were renamed correctly!")
             return True
@@ -4,23 +4,22 @@ Test script to verify zero_num parameter is present in GUI.
 This test checks the GUI code for the presence of the zero_num spinbox.
 """
 
+import ast
 import sys
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _gui_source import GUI_FILE, find_markers, gui_methods
 
 
 def test_gui_code_verification():
     """Verify that zero_num spinbox exists in GUI code."""
-    gui_path = Path(__file__).parent.parent / "gui.py"
-
     print("Testing GUI code for zero_num parameter")
     print("=" * 60)
-    print(f"Reading file: {gui_path}")
-
-    with open(gui_path, 'r', encoding='utf-8') as f:
-        gui_code = f.read()
+    print(f"Reading file: {GUI_FILE}")
 
     # Check for key elements
     checks = [
@@ -31,23 +30,42 @@ def test_gui_code_verification():
         ("(0 = не используется, 1 = 09, 2 = 009)", "Help text for zero_num"),
     ]
 
+    # Look for all strings in one pass over the source
+    found = find_markers(search_str for search_str, _ in checks)
+
     all_passed = True
     for search_str, description in checks:
-        if search_str in gui_code:
+        if search_str in found:
             print(f"✓ Found: {description}")
         else:
             print(f"✗ Missing: {description}")
             all_passed = False
 
-    # Check FileRenamerThread __init__ signature
-    if "zero_num: int = 0" in gui_code:
+    renamer_methods = gui_methods().get("FileRenamerThread", {})
+
+    # Check FileRenamerThread __init__ signature: zero_num with default 0
+    init = renamer_methods.get("__init__")
+    has_zero_num_param = False
+    if init is not None:
+        params = [arg.arg for arg in init.args.args]
+        # Defaults belong to the last parameters
+        defaults = dict(zip(params[len(params) - len(init.args.defaults):], init.args.defaults))
+        default = defaults.get("zero_num")
+        has_zero_num_param = isinstance(default, ast.Constant) and default.value == 0
+    if has_zero_num_param:
         print("✓ Found: zero_num parameter in FileRenamerThread.__init__")
     else:
         print("✗ Missing: zero_num parameter in FileRenamerThread.__init__")
         all_passed = False
 
     # Check that zero_num is passed to generate_new_filename
-    if "self.zero_num" in gui_code:
+    run = renamer_methods.get("run")
+    uses_zero_num = run is not None and any(
+        isinstance(node, ast.Attribute) and node.attr == "zero_num"
+        and isinstance(node.value, ast.Name) and node.value.id == "self"
+        for node in ast.walk(run)
+    )
+    if uses_zero_num:
         print("✓ Found: self.zero_num in FileRenamerThread")
     else:
         print("✗ Missing: self.zero_num in FileRenamerThread")
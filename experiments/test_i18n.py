@@ -13,6 +13,43 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from translations import Translations, get_translator, tr
 
 
+# Keys checked in both languages
+REQUIRED_KEYS = frozenset({
+    "window_title",
+    "ready",
+    "tab_video_resize",
+    "tab_file_download",
+    "tab_file_rename",
+    "language",
+    "language_en",
+    "language_ru",
+})
+
+# Keys used by the GUI tabs
+GUI_KEYS = frozenset({
+    "video_title",
+    "download_title",
+    "rename_title",
+    "settings",
+    "browse",
+    "start_processing",
+    "start_download",
+    "start_rename",
+    "stop",
+    "zero_padding",
+    "zero_padding_hint",
+    "dry_run",
+    "skip_hyperlinks",
+    "parallel_downloads",
+    "parallel_jobs",
+    "use_gpu",
+    "verbose_log",
+})
+
+# Every key the checks below need, in one set
+ALL_KEYS = REQUIRED_KEYS | GUI_KEYS
+
+
 def test_translations():
     """Test translation functionality."""
     print("Testing Internationalization (i18n) Implementation")
@@ -23,38 +60,46 @@ def test_translations():
     print("-" * 60)
     translator_en = Translations("en")
 
-    test_keys = [
-        "window_title",
-        "ready",
-        "tab_video_resize",
-        "tab_file_download",
-        "tab_file_rename",
-        "language",
-        "language_en",
-        "language_ru",
-    ]
+    # Key sets of both languages, shared by all checks below
+    en_keys = Translations._EN_KEYSET
+    ru_keys = Translations._RU_KEYSET
+
+    # Required and GUI keys are checked with one set difference per language
+    missing_en = ALL_KEYS - en_keys
+    missing_ru = ALL_KEYS - ru_keys
 
     all_passed = True
-    for key in test_keys:
-        value = translator_en.get(key)
-        if value and value != key:
-            print(f"✓ {key}: {value}")
-        else:
-            print(f"✗ {key}: MISSING")
-            all_passed = False
+    if missing_en:
+        print(f"✗ Keys missing in English: {sorted(missing_en)}")
+        all_passed = False
+    else:
+        print(f"✓ All {len(ALL_KEYS)} required and GUI keys present")
+
+    # Every present key must be translated: not empty and not the key itself
+    untranslated = sorted(key for key in ALL_KEYS & en_keys if translator_en.get(key) in ("", key))
+    if untranslated:
+        print(f"✗ Keys without English text: {untranslated}")
+        all_passed = False
+    else:
+        print("✓ All required and GUI keys have English text")
 
     # Test 2: Create Russian translator
     print("\nTest 2: Russian Translation")
     print("-" * 60)
     translator_ru = Translations("ru")
 
-    for key in test_keys:
-        value = translator_ru.get(key)
-        if value and value != key:
-            print(f"✓ {key}: {value}")
-        else:
-            print(f"✗ {key}: MISSING")
-            all_passed = False
+    if missing_ru:
+        print(f"✗ Keys missing in Russian: {sorted(missing_ru)}")
+        all_passed = False
+    else:
+        print(f"✓ All {len(ALL_KEYS)} required and GUI keys present")
+
+    untranslated = sorted(key for key in ALL_KEYS & ru_keys if translator_ru.get(key) in ("", key))
+    if untranslated:
+        print(f"✗ Keys without Russian text: {untranslated}")
+        all_passed = False
+    else:
+        print("✓ All required and GUI keys have Russian text")
 
     # Test 3: Test formatting with arguments
     print("\nTest 3: Translation with Arguments")
@@ -86,9 +131,6 @@ def test_translations():
     print("\nTest 5: Verify All Keys Exist in Both Languages")
     print("-" * 60)
 
-    en_keys = set(Translations.EN.keys())
-    ru_keys = set(Translations.RU.keys())
-
     missing_in_ru = en_keys - ru_keys
     missing_in_en = ru_keys - en_keys
 
@@ -106,34 +148,6 @@ def test_translations():
 
     print(f"\nTotal keys: {len(en_keys)}")
 
-    # Test 6: Check for GUI-specific keys
-    print("\nTest 6: GUI-Specific Keys")
-    print("-" * 60)
-
-    gui_keys = [
-        "video_title",
-        "download_title",
-        "rename_title",
-        "settings",
-        "browse",
-        "start_processing",
-        "start_download",
-        "start_rename",
-        "stop",
-        "zero_padding",
-        "zero_padding_hint",
-        "dry_run"
-    ]
-
-    for key in gui_keys:
-        en_val = translator_en.get(key)
-        ru_val = translator_ru.get(key)
-        if en_val != key and ru_val != key:
-            print(f"✓ {key}: EN='{en_val}' RU='{ru_val}'")
-        else:
-            print(f"✗ {key}: MISSING in one or both languages")
-            all_passed = False
-
     # Final result
     print("\n" + "=" * 60)
     if all_passed:
@@ -8,14 +8,15 @@ from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
 
-from PyQt6.QtWidgets import QApplication
+from _qtapp import qt_app
 from gui import MainWindow
 
 
 def main():
     """Test language switching functionality."""
-    app = QApplication(sys.argv)
+    app = qt_app()
 
     # Create main window
     window = MainWindow()
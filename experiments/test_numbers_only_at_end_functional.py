@@ -10,7 +10,9 @@ from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
 
+from _fixtures import create_files, file_names
 from rename import rename_files
 
 
@@ -31,8 +33,7 @@ def test_numbers_only_at_end_functionality():
             "test.png"       # Should use sequential numbering (no number)
         ]
 
-        for filename in test_files:
-            (temp_path / filename).touch()
+        create_files(temp_path, test_files)
 
         print("Created test files:")
         for filename in test_files:
@@ -66,7 +67,7 @@ def test_numbers_only_at_end_functionality():
 
         # Check the results
         print("\n=== Renamed Files ===")
-        renamed_files = sorted([f.name for f in temp_path.iterdir() if f.is_file()])
+        renamed_files = sorted(file_names(temp_path))
         for filename in renamed_files:
             print(f"  - {filename}")
 
@@ -4,9 +4,13 @@ Experiment script to test thumbnail extraction from video files using FFmpeg.
 This script tests extracting a single frame from a video and saving it as JPG.
 """
 
+import logging
+import os
 from pathlib import Path
 from ffmpeg import FFmpeg
 
+logger = logging.getLogger(__name__)
+
 
 def create_thumbnail(input_path: Path, output_path: Path, time_seconds: float = 1.0) -> bool:
     """
@@ -21,37 +25,48 @@ def create_thumbnail(input_path: Path, output_path: Path, time_seconds: float =
         True if successful, False otherwise
     """
     try:
-        print(f"Creating thumbnail from: {input_path.name}")
-        print(f"Output: {output_path}")
-        print(f"Time position: {time_seconds}s")
+        logger.info("Creating thumbnail from: %s", input_path.name)
+        logger.info("Output: %s", output_path)
+        logger.info("Time position: %ss", time_seconds)
 
         # Create FFmpeg instance
         # Use -ss before input for faster seeking (keyframe-based)
+        # and decode only keyframes: the first keyframe at the seek point
+        # is the thumbnail. -noaccurate_seek keeps the keyframe before the
+        # seek point, so short clips with a single keyframe still produce
+        # a frame
         ffmpeg = (
             FFmpeg()
             .option("y")  # Overwrite output file if exists
             .option("ss", time_seconds)  # Seek to specific time
-            .input(str(input_path))
+            # Let the decoder pick its thread count from the CPU cores
+            .input(str(input_path), noaccurate_seek=None, skip_frame="nokey", threads=0)
             .output(
                 str(output_path),
-                {"vframes": 1},  # Extract 1 frame
-                vf="thumbnail"  # Use thumbnail filter to select best frame
+                # Extract 1 frame, skip audio, keep keyframe timestamps,
+                # fixed JPG quality (2-31, lower is better)
+                {"vframes": 1, "an": None, "vsync": "passthrough", "qscale:v": 3}
             )
         )
 
-        print("FFmpeg command ready, executing...")
+        logger.info("FFmpeg command ready, executing...")
         ffmpeg.execute()
 
-        if output_path.exists():
-            print(f"✓ Thumbnail created successfully: {output_path}")
-            print(f"  File size: {output_path.stat().st_size} bytes")
-            return True
-        else:
-            print("✗ Thumbnail file was not created")
+        # ffmpeg exits successfully without writing a file when no frame is
+        # found (e.g. the seek position is past the end), so one stat both
+        # confirms the file and gives its size
+        try:
+            size = os.stat(output_path).st_size
+        except OSError:
+            logger.error("✗ Thumbnail file was not created")
             return False
 
+        logger.info("✓ Thumbnail created successfully: %s", output_path)
+        logger.info("  File size: %s bytes", size)
+        return True
+
     except Exception as e:
-        print(f"✗ Error creating thumbnail: {str(e)}")
+        logger.error("✗ Error creating thumbnail: %s", e)
         return False
 
 
@@ -80,4 +95,5 @@ def test_thumbnail_creation():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     test_thumbnail_creation()
@@ -6,55 +6,228 @@ Provides a graphical interface for batch resizing videos using FFmpeg.
 
 import sys
 import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from functools import partial
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Optional, List
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QSpinBox, QCheckBox, QFileDialog,
     QTextEdit, QProgressBar, QGroupBox, QMessageBox, QTabWidget, QComboBox
 )
-from PyQt6.QtCore import QThread, pyqtSignal, Qt
+from PyQt6.QtCore import QRunnable, QThread, QThreadPool, QTimer, pyqtSignal, Qt
 from PyQt6.QtGui import QFont
 
-from main import get_video_files, resize_video, create_thumbnail
+from main import (
+    get_video_files, resize_video, resize_video_with_thumbnail, create_thumbnail,
+    is_gpu_available, get_encoder_threads, DEFAULT_VIDEO_JOBS, GPU_MAX_SESSIONS
+)
 from download import (
-    read_file, get_filename_from_url, download_file
+    read_file, get_filename_from_url, get_target_filename, download_file,
+    DEFAULT_DOWNLOAD_WORKERS, MAX_DOWNLOAD_WORKERS
 )
 from rename import (
-    get_files_in_folder, sort_files, rename_files
+    get_files_in_folder, sort_files, rename_files, plan_renames
 )
 from translations import get_translator, tr
 
 
-class VideoProcessorThread(QThread):
-    """Background thread for processing videos to keep UI responsive."""
+# Thumbnails are single-frame extractions, so two workers keep up with the resize pool
+THUMBNAIL_WORKERS = 2
+
+# Videos queued per resize worker; the rest are submitted as the queued ones finish,
+# so a stop request only has to skip a few queued videos
+VIDEO_QUEUE_PER_JOB = 2
+
+# Log lines of a worker are collected and sent to the UI at most this often (seconds)
+LOG_FLUSH_INTERVAL = 0.1
+
+# Progress is sent to the UI at most this often (seconds), except for the final 100%
+PROGRESS_EMIT_INTERVAL = 0.1
+
+# Older log lines are dropped beyond this many, so long runs do not grow the log without bound
+LOG_MAX_BLOCKS = 2000
+
+
+class FutureJob(QRunnable):
+    """Job for a Qt thread pool that reports the result of a callable through a Future."""
+
+    def __init__(self, fn: Callable, *args):
+        super().__init__()
+        self.future: Future = Future()
+        self._fn = fn
+        self._args = args
+
+    def run(self):
+        """Run the callable in a pool thread and store its result or exception."""
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            self.future.set_result(self._fn(*self._args))
+        except BaseException as e:
+            self.future.set_exception(e)
+
+
+def submit_job(pool: QThreadPool, fn: Callable, *args) -> Future:
+    """
+    Start fn(*args) on a Qt thread pool.
+
+    Args:
+        pool: Thread pool to run the job on
+        fn: Callable to run
+        *args: Arguments for the callable
+
+    Returns:
+        Future with the result of the call
+    """
+    job = FutureJob(fn, *args)
+    # Keep the future: the pool deletes the job once it has run
+    future = job.future
+    pool.start(job)
+    return future
+
+
+_thumbnail_pool: Optional[QThreadPool] = None
+
+
+def get_thumbnail_pool() -> QThreadPool:
+    """Get the thread pool for thumbnail jobs; it is created once and its threads are reused by later runs."""
+    global _thumbnail_pool
+    if _thumbnail_pool is None:
+        _thumbnail_pool = QThreadPool()
+        _thumbnail_pool.setMaxThreadCount(THUMBNAIL_WORKERS)
+    return _thumbnail_pool
+
+
+_download_pool: Optional[QThreadPool] = None
+
+
+def get_download_pool() -> QThreadPool:
+    """Get the thread pool for download jobs; it is created once and its threads are reused by later runs."""
+    global _download_pool
+    if _download_pool is None:
+        _download_pool = QThreadPool()
+    return _download_pool
+
+
+class WorkerThread(QThread):
+    """Base for worker threads that send their log messages and progress to the UI sparingly."""
 
     progress = pyqtSignal(int)  # Progress percentage
-    log = pyqtSignal(str)  # Log message
+    log = pyqtSignal(list)  # Batch of log messages
+
+    def __init__(self):
+        super().__init__()
+        self._log_buffer: List[str] = []
+        self._log_lock = threading.Lock()
+        self._last_log_flush = 0.0
+        self._last_progress = -1
+        self._last_progress_time = 0.0
+
+    def _log(self, message: str):
+        """Queue a log message; it is sent with the next batch."""
+        with self._log_lock:
+            self._log_buffer.append(message)
+
+    def _flush_logs(self, force: bool = True):
+        """Send all queued log messages to the UI as one batch, unless not forced and sent recently."""
+        now = time.monotonic()
+        if not force and now - self._last_log_flush < LOG_FLUSH_INTERVAL:
+            return
+        with self._log_lock:
+            messages, self._log_buffer = self._log_buffer, []
+        if messages:
+            self._last_log_flush = now
+            self.log.emit(messages)
+
+    def _emit_progress(self, done: int, total: int, force: bool = False):
+        """Emit progress only when the percentage changes, at most every PROGRESS_EMIT_INTERVAL unless forced."""
+        progress_percent = done * 100 // total
+        now = time.monotonic()
+        if progress_percent != self._last_progress and (
+            force or done == total or now - self._last_progress_time >= PROGRESS_EMIT_INTERVAL
+        ):
+            self._last_progress = progress_percent
+            self._last_progress_time = now
+            self.progress.emit(progress_percent)
+
+
+class VideoProcessorThread(WorkerThread):
+    """Background thread for processing videos to keep UI responsive."""
+
     finished = pyqtSignal(dict)  # Processing statistics
 
-    def __init__(self, folder_path: Path, height: int, remove_audio: bool, create_thumbs: bool, translator):
+    def __init__(self, folder_path: Path, height: int, remove_audio: bool, create_thumbs: bool, translator,
+                 jobs: int = DEFAULT_VIDEO_JOBS, use_gpu: bool = False, verbose: bool = True):
         super().__init__()
         self.folder_path = folder_path
         self.height = height
         self.remove_audio = remove_audio
         self.create_thumbs = create_thumbs
         self.translator = translator
+        self.jobs = jobs
+        self.use_gpu = use_gpu
+        self.verbose = verbose  # Log every step of every file, not only errors and totals
+        self._threads = 0  # Encoder threads per job, set when the number of workers is known
         self._is_running = True
+        self._thumbs_lock = threading.Lock()
+        self._thumbs_created = 0
+        self._thumbs_failed = 0
 
     def stop(self):
         """Stop processing."""
         self._is_running = False
 
+    def _resize(self, video_file: Path, output_path: Path, thumb_path: Optional[Path] = None) -> Optional[bool]:
+        """
+        Resize one video in a worker thread of the pool, or return None if stopped before it started.
+        If thumb_path is given, the thumbnail is created by the same FFmpeg run.
+        """
+        if not self._is_running:
+            return None
+        if self.verbose:
+            self._log(self.translator.get("processing_file", video_file.name))
+        if thumb_path is None:
+            return resize_video(video_file, output_path, self.height, self.remove_audio, self.use_gpu, self._threads)
+
+        resized, created = resize_video_with_thumbnail(
+            video_file, output_path, thumb_path, self.height, self.remove_audio, threads=self._threads
+        )
+        if resized:
+            self._thumbnail_result(thumb_path, created)
+        return resized
+
+    def _thumbnail_done(self, thumb_path: Path, future: Future):
+        """Count and log the result of a thumbnail job as soon as it finishes."""
+        self._thumbnail_result(thumb_path, future.result())
+
+    def _thumbnail_result(self, thumb_path: Path, created: bool):
+        """Count and log a created or failed thumbnail."""
+        with self._thumbs_lock:
+            if created:
+                self._thumbs_created += 1
+            else:
+                self._thumbs_failed += 1
+
+        if created:
+            if self.verbose:
+                self._log(self.translator.get("thumb_created", thumb_path.name))
+        else:
+            self._log(self.translator.get("thumb_error", thumb_path.name))
+
     def run(self):
         """Process videos in background thread."""
         try:
-            # Get video files
+            # Read the folder once, sorted like the CLI, so the count and the jobs agree
             video_files = get_video_files(self.folder_path)
+            total = len(video_files)
 
-            if not video_files:
-                self.log.emit(self.translator.get("videos_not_found", self.folder_path))
+            if not total:
+                self._log(self.translator.get("videos_not_found", self.folder_path))
+                self._flush_logs()
                 self.finished.emit({
                     'successful': 0,
                     'failed': 0,
@@ -64,67 +237,121 @@ class VideoProcessorThread(QThread):
                 })
                 return
 
-            self.log.emit(self.translator.get("videos_found", len(video_files), self.folder_path))
+            self._log(self.translator.get("videos_found", total, self.folder_path))
+
+            # The GPU is checked once here; resize_video falls back to the CPU on its own
+            if self.use_gpu:
+                if is_gpu_available():
+                    self._log(self.translator.get("gpu_enabled"))
+                else:
+                    self._log(self.translator.get("gpu_not_available"))
 
             # Create output directory
             output_dir = self.folder_path / "output"
             output_dir.mkdir(exist_ok=True)
-            self.log.emit(self.translator.get("output_folder", output_dir))
+            self._log(self.translator.get("output_folder", output_dir))
 
             # Create thumbs directory if needed
             thumbs_dir = None
             if self.create_thumbs:
                 thumbs_dir = self.folder_path / "thumbs"
                 thumbs_dir.mkdir(exist_ok=True)
-                self.log.emit(self.translator.get("thumbs_folder", thumbs_dir))
+                self._log(self.translator.get("thumbs_folder", thumbs_dir))
 
             # Process each video file
             successful = 0
             failed = 0
-            thumbs_created = 0
-            thumbs_failed = 0
-
-            for idx, video_file in enumerate(video_files):
-                if not self._is_running:
-                    self.log.emit(self.translator.get("processing_stopped"))
+            stopped = False
+
+            # Resize up to self.jobs videos at the same time; thumbnails of finished
+            # videos are created in their own pool while the next videos are resized.
+            # Both are Qt thread pools that outlive the run, so later runs reuse their threads
+            on_gpu = self.use_gpu and is_gpu_available()
+            workers = max(1, min(self.jobs, total))
+            if on_gpu:
+                # The GPU only has a few encoder sessions; more workers would just
+                # wait for one in resize_video
+                workers = min(workers, GPU_MAX_SESSIONS)
+            self._threads = get_encoder_threads(workers)
+            resize_pool = QThreadPool.globalInstance()
+            resize_pool.setMaxThreadCount(workers)
+            thumb_pool = get_thumbnail_pool()
+
+            # On the CPU the thumbnail is taken in the resize run itself; GPU frames
+            # stay on the GPU, so there it is extracted from the output afterwards
+            fuse_thumbs = self.create_thumbs and not on_gpu
+
+            # Only a few videos per worker are queued at a time
+            pending_files = iter(video_files)
+            futures = {}
+            done = 0
+            while True:
+                while self._is_running and len(futures) < workers * VIDEO_QUEUE_PER_JOB:
+                    video_file = next(pending_files, None)
+                    if video_file is None:
+                        break
+                    output_path = output_dir / video_file.name
+                    thumb_path = thumbs_dir / f"{video_file.stem}.jpg" if fuse_thumbs else None
+                    future = submit_job(resize_pool, self._resize, video_file, output_path, thumb_path)
+                    futures[future] = (video_file, output_path)
+
+                if not futures:
                     break
 
-                output_path = output_dir / video_file.name
+                # Wake up at least every LOG_FLUSH_INTERVAL to send queued log lines
+                # and to notice a stop request while long encodes are running
+                finished_futures, _ = wait(futures, timeout=LOG_FLUSH_INTERVAL, return_when=FIRST_COMPLETED)
+
+                for future in finished_futures:
+                    video_file, output_path = futures.pop(future)
+                    result = future.result()
+                    if result is not None:  # None: skipped because processing was stopped
+                        done += 1
+                    if result:
+                        successful += 1
+                        if self.verbose:
+                            self._log(self.translator.get("completed", output_path.name))
+
+                        # Create thumbnail if requested
+                        if self.create_thumbs and not fuse_thumbs and self._is_running:
+                            thumb_path = thumbs_dir / f"{video_file.stem}.jpg"
+                            if self.verbose:
+                                self._log(self.translator.get("creating_thumb", thumb_path.name))
+                            thumb_future = submit_job(thumb_pool, create_thumbnail, output_path, thumb_path)
+                            thumb_future.add_done_callback(partial(self._thumbnail_done, thumb_path))
+                    elif result is not None:
+                        failed += 1
+                        self._log(self.translator.get("error_processing", video_file.name))
 
-                self.log.emit(self.translator.get("processing_file", video_file.name))
-                if resize_video(video_file, output_path, self.height, self.remove_audio):
-                    successful += 1
-                    self.log.emit(self.translator.get("completed", output_path.name))
-                else:
-                    failed += 1
-                    self.log.emit(self.translator.get("error_processing", video_file.name))
-
-                # Create thumbnail if requested
-                if self.create_thumbs and self._is_running:
-                    thumb_path = thumbs_dir / f"{video_file.stem}.jpg"
-                    self.log.emit(self.translator.get("creating_thumb", thumb_path.name))
-                    if create_thumbnail(output_path, thumb_path):
-                        thumbs_created += 1
-                        self.log.emit(self.translator.get("thumb_created", thumb_path.name))
-                    else:
-                        thumbs_failed += 1
-                        self.log.emit(self.translator.get("thumb_error", thumb_path.name))
+                # Videos that have not been queued are dropped, queued ones are
+                # skipped by _resize and running ones finish
+                if not self._is_running and not stopped:
+                    stopped = True
+                    self._log(self.translator.get("processing_stopped"))
 
-                # Update progress
-                progress_percent = int((idx + 1) / len(video_files) * 100)
-                self.progress.emit(progress_percent)
+                # Update progress; a value skipped by the throttle is sent on a later wakeup
+                self._emit_progress(done, total)
+                self._flush_logs()
+
+            # Send the last value the throttle may have held back
+            self._emit_progress(done, total, force=True)
+
+            # Wait for the thumbnails still being created
+            thumb_pool.waitForDone()
 
             # Emit final statistics
+            self._flush_logs()
             self.finished.emit({
                 'successful': successful,
                 'failed': failed,
-                'total': len(video_files),
-                'thumbs_created': thumbs_created,
-                'thumbs_failed': thumbs_failed
+                'total': total,
+                'thumbs_created': self._thumbs_created,
+                'thumbs_failed': self._thumbs_failed
             })
 
         except Exception as e:
-            self.log.emit(self.translator.get("critical_error", str(e)))
+            self._log(self.translator.get("critical_error", str(e)))
+            self._flush_logs()
             self.finished.emit({
                 'successful': 0,
                 'failed': 0,
@@ -134,19 +361,20 @@ class VideoProcessorThread(QThread):
             })
 
 
-class FileDownloaderThread(QThread):
+class FileDownloaderThread(WorkerThread):
     """Background thread for downloading files from URLs found in XLS/XLSX/CSV files."""
 
-    progress = pyqtSignal(int)  # Progress percentage
-    log = pyqtSignal(str)  # Log message
     finished = pyqtSignal(dict)  # Download statistics
 
-    def __init__(self, file_path: Path, output_folder: Path, column_index_name: int, translator):
+    def __init__(self, file_path: Path, output_folder: Path, column_index_name: int, translator,
+                 scan_hyperlinks: bool = True, workers: int = DEFAULT_DOWNLOAD_WORKERS):
         super().__init__()
         self.file_path = file_path
         self.output_folder = output_folder
         self.column_index_name = column_index_name
+        self.scan_hyperlinks = scan_hyperlinks
         self.translator = translator
+        self.workers = workers
         self._is_running = True
 
     def stop(self):
@@ -157,19 +385,13 @@ class FileDownloaderThread(QThread):
         """Download files in background thread."""
         try:
             # Read file and extract URLs with custom filenames
-            self.log.emit(self.translator.get("reading_file", self.file_path))
-            url_data = read_file(self.file_path, self.column_index_name)
-
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_url_data = []
-            for url, custom_name in url_data:
-                if url not in seen:
-                    seen.add(url)
-                    unique_url_data.append((url, custom_name))
+            self._log(self.translator.get("reading_file", self.file_path))
+            # URLs are deduplicated while reading, keeping the first occurrence
+            unique_url_data = read_file(self.file_path, self.column_index_name, scan_hyperlinks=self.scan_hyperlinks)
 
             if not unique_url_data:
-                self.log.emit(self.translator.get("urls_not_found"))
+                self._log(self.translator.get("urls_not_found"))
+                self._flush_logs()
                 self.finished.emit({
                     'successful': 0,
                     'failed': 0,
@@ -179,107 +401,148 @@ class FileDownloaderThread(QThread):
                 })
                 return
 
-            self.log.emit(self.translator.get("urls_found", len(unique_url_data)))
+            total = len(unique_url_data)
+            self._log(self.translator.get("urls_found", total))
 
             # Create output folder if it doesn't exist
             self.output_folder.mkdir(parents=True, exist_ok=True)
-            self.log.emit(self.translator.get("download_folder_created", self.output_folder))
+            self._log(self.translator.get("download_folder_created", self.output_folder))
 
             # Download each file
             successful = 0
             failed = 0
             skipped = 0
             renamed = 0
+            processed = 0
+            stopped = False
+
+            # Resolve target names and handle existing files one by one; every file
+            # to fetch is started on the pool right away, so the downloads overlap
+            # the checks of the URLs after it (downloads are I/O bound)
+            download_pool = get_download_pool()
+            download_pool.setMaxThreadCount(max(1, min(self.workers, total)))
+            futures = {}
+            queued = set()
+
+            # Names already in the output folder, read with one directory scan
+            # instead of a stat() per URL
+            with os.scandir(self.output_folder) as entries:
+                existing = {os.path.normcase(entry.name) for entry in entries}
 
             for idx, (url, custom_name) in enumerate(unique_url_data):
+                # Send the lines of quickly skipped files together
+                self._flush_logs(force=False)
+
                 if not self._is_running:
-                    self.log.emit(self.translator.get("processing_stopped"))
+                    # Downloads already running are finished, queued ones are dropped
+                    self._log(self.translator.get("processing_stopped"))
+                    stopped = True
+                    for future in futures:
+                        future.cancel()
                     break
 
-                self.log.emit(self.translator.get("processing_url", idx + 1, len(unique_url_data), url))
+                self._log(self.translator.get("processing_url", idx + 1, total, url))
 
                 # Get filename from URL
                 original_filename = get_filename_from_url(url)
                 original_path = self.output_folder / original_filename
 
-                # Determine final filename
-                final_filename = original_filename
-                final_path = original_path
-
-                if custom_name:
-                    # Preserve file extension from original filename
-                    original_ext = Path(original_filename).suffix
-                    # If custom_name already has extension, use it as is, otherwise add original extension
-                    if Path(custom_name).suffix:
-                        final_filename = custom_name
-                    else:
-                        final_filename = custom_name + original_ext
-                    final_path = self.output_folder / final_filename
+                # Determine final filename (custom name keeps the original extension)
+                final_filename = get_target_filename(original_filename, custom_name)
+                final_path = self.output_folder / final_filename if custom_name else original_path
 
-                # Check if final file already exists
-                if final_path.exists():
-                    self.log.emit(self.translator.get("skipped_exists", final_filename))
+                # Check if final file already exists (or is already queued for download)
+                final_key = os.path.normcase(final_filename)
+                if final_key in existing or final_key in queued:
+                    self._log(self.translator.get("skipped_exists", final_filename))
                     skipped += 1
                     # Update progress
-                    progress_percent = int((idx + 1) / len(unique_url_data) * 100)
-                    self.progress.emit(progress_percent)
+                    processed += 1
+                    self._emit_progress(processed, total)
                     continue
 
                 # Check if original file already exists
-                if original_path.exists() and original_path != final_path:
+                if original_path != final_path and os.path.normcase(original_filename) in existing:
                     # File with original name exists, and we have a custom name
                     if custom_name:
                         # Rename the existing file
                         try:
                             original_path.rename(final_path)
-                            self.log.emit(self.translator.get("renamed_existing", original_filename, final_filename))
+                            existing.discard(os.path.normcase(original_filename))
+                            existing.add(final_key)
+                            self._log(self.translator.get("renamed_existing", original_filename, final_filename))
                             renamed += 1
                             skipped += 1
                         except Exception as e:
-                            self.log.emit(self.translator.get("rename_error", original_filename, str(e)))
+                            self._log(self.translator.get("rename_error", original_filename, str(e)))
                             failed += 1
                     else:
                         # No custom name, file already exists
-                        self.log.emit(self.translator.get("skipped_exists", original_filename))
+                        self._log(self.translator.get("skipped_exists", original_filename))
                         skipped += 1
 
                     # Update progress
-                    progress_percent = int((idx + 1) / len(unique_url_data) * 100)
-                    self.progress.emit(progress_percent)
+                    processed += 1
+                    self._emit_progress(processed, total)
                     continue
 
-                # Download the file to original path first
-                if download_file(url, original_path):
-                    # If we have a custom name and it's different from original, rename
-                    if custom_name and final_path != original_path:
-                        try:
-                            original_path.rename(final_path)
-                            self.log.emit(self.translator.get("downloaded_renamed", final_filename))
+                # Download straight to the final path so concurrent downloads never
+                # share a temporary file name
+                queued.add(final_key)
+                future = submit_job(download_pool, download_file, url, final_path)
+                futures[future] = (url, original_filename, final_filename)
+
+            # Collect the downloads, up to self.workers of them run at the same time
+            self._flush_logs()
+            while futures:
+                # Wake up regularly to send log lines and check for stop
+                finished, _ = wait(futures, timeout=LOG_FLUSH_INTERVAL, return_when=FIRST_COMPLETED)
+
+                if not self._is_running and not stopped:
+                    # Downloads already running are finished, queued ones are dropped
+                    self._log(self.translator.get("processing_stopped"))
+                    stopped = True
+                    for future in futures:
+                        future.cancel()
+
+                for future in finished:
+                    url, original_filename, final_filename = futures.pop(future)
+                    if future.cancelled():
+                        continue
+
+                    if future.result():
+                        if final_filename != original_filename:
+                            self._log(self.translator.get("downloaded_renamed", final_filename))
                             renamed += 1
-                        except Exception as e:
-                            self.log.emit(self.translator.get("downloaded_rename_failed", original_filename, str(e)))
+                        else:
+                            self._log(self.translator.get("downloaded", original_filename))
+                        successful += 1
                     else:
-                        self.log.emit(self.translator.get("downloaded", original_filename))
-                    successful += 1
-                else:
-                    self.log.emit(self.translator.get("download_error", url))
-                    failed += 1
+                        self._log(self.translator.get("download_error", url))
+                        failed += 1
+
+                    processed += 1
 
                 # Update progress
-                progress_percent = int((idx + 1) / len(unique_url_data) * 100)
-                self.progress.emit(progress_percent)
+                self._emit_progress(processed, total)
+                self._flush_logs()
+
+            # Send the last value the throttle may have held back
+            self._emit_progress(processed, total, force=True)
 
             # Emit final statistics
+            self._flush_logs()
             self.finished.emit({
                 'successful': successful,
                 'failed': failed,
                 'skipped': skipped,
                 'renamed': renamed,
-                'total': len(unique_url_data)
+                'total': total
             })
 
         except Exception as e:
-            self.log.emit(self.translator.get("critical_error", str(e)))
+            self._log(self.translator.get("critical_error", str(e)))
+            self._flush_logs()
             self.finished.emit({
                 'successful': 0,
                 'failed': 0,
@@ -289,11 +552,9 @@ class FileDownloaderThread(QThread):
             })
 
 
-class FileRenamerThread(QThread):
+class FileRenamerThread(WorkerThread):
     """Background thread for renaming files to keep UI responsive."""
 
-    progress = pyqtSignal(int)  # Progress percentage
-    log = pyqtSignal(str)  # Log message
     finished = pyqtSignal(dict)  # Rename statistics
 
     def __init__(self, folder_path: Path, sort_type: str, rename_type: str,
@@ -306,7 +567,7 @@ class FileRenamerThread(QThread):
         self.suffix = suffix
         self.dry_run = dry_run
         self.zero_num = zero_num
-        self.translator = translator
+        self.translator = translator or get_translator()
         self._is_running = True
 
     def stop(self):
@@ -320,7 +581,8 @@ class FileRenamerThread(QThread):
             files = get_files_in_folder(self.folder_path)
 
             if not files:
-                self.log.emit(self.translator.get("files_not_found", self.folder_path))
+                self._log(self.translator.get("files_not_found", self.folder_path))
+                self._flush_logs()
                 self.finished.emit({
                     'successful': 0,
                     'failed': 0,
@@ -328,94 +590,87 @@ class FileRenamerThread(QThread):
                 })
                 return
 
-            self.log.emit(self.translator.get("files_found", len(files), self.folder_path))
+            total = len(files)
+            self._log(self.translator.get("files_found", total, self.folder_path))
 
             # Display configuration
-            self.log.emit(self.translator.get("configuration"))
-            self.log.emit(self.translator.get("folder", self.folder_path))
-            self.log.emit(self.translator.get("sort_type", self.sort_type))
-            self.log.emit(self.translator.get("rename_type_label", self.rename_type))
+            self._log(self.translator.get("configuration"))
+            self._log(self.translator.get("folder", self.folder_path))
+            self._log(self.translator.get("sort_type", self.sort_type))
+            self._log(self.translator.get("rename_type_label", self.rename_type))
             if self.prefix:
-                self.log.emit(self.translator.get("prefix_label", self.prefix))
+                self._log(self.translator.get("prefix_label", self.prefix))
             if self.suffix:
-                self.log.emit(self.translator.get("suffix_label", self.suffix))
+                self._log(self.translator.get("suffix_label", self.suffix))
             if self.zero_num > 0:
-                self.log.emit(self.translator.get("zero_padding_label", self.zero_num))
+                self._log(self.translator.get("zero_padding_label", self.zero_num))
             if self.dry_run:
-                self.log.emit(self.translator.get("mode"))
-            self.log.emit("")
+                self._log(self.translator.get("mode"))
+            self._log("")
 
             # Sort files
             sorted_files = sort_files(files, self.sort_type)
 
             if self.dry_run:
-                self.log.emit(self.translator.get("preview_mode"))
-                self.log.emit("=" * 60)
+                self._log(self.translator.get("preview_mode"))
+                self._log("=" * 60)
 
             successful = 0
             failed = 0
 
-            # Keep track of new names to avoid duplicates
-            used_names = set()
+            # New names are generated like in rename.py; duplicates get a counter
+            renames = plan_renames(
+                sorted_files, self.rename_type, self.prefix, self.suffix, self.zero_num
+            )
 
-            from rename import generate_new_filename
+            for index, file_path, new_filename in renames:
+                self._flush_logs(force=False)
 
-            for index, file_path in enumerate(sorted_files, start=1):
                 if not self._is_running:
-                    self.log.emit(self.translator.get("processing_stopped"))
+                    self._log(self.translator.get("processing_stopped"))
                     break
 
                 try:
-                    # Generate new filename
-                    new_filename = generate_new_filename(
-                        file_path, index, self.rename_type, self.prefix, self.suffix, self.zero_num
-                    )
-
-                    # Handle duplicate names by adding a counter
-                    original_new_filename = new_filename
-                    counter = 1
-                    while new_filename in used_names:
-                        # Insert counter before extension
-                        stem = Path(original_new_filename).stem
-                        ext = Path(original_new_filename).suffix
-                        new_filename = f"{stem}_{counter}{ext}"
-                        counter += 1
-
-                    used_names.add(new_filename)
                     new_path = file_path.parent / new_filename
 
-                    # Check if target file already exists (and it's not the same file)
-                    if new_path.exists() and new_path.resolve() != file_path.resolve():
-                        self.log.emit(self.translator.get("target_exists", new_filename))
+                    # Check if target file already exists (and it's not the same file; both
+                    # are in the same folder, so comparing names is enough, except on case-insensitive
+                    # filesystems, where a case-only rename finds the source file itself)
+                    if new_filename != file_path.name and new_path.exists() and not new_path.samefile(file_path):
+                        self._log(self.translator.get("target_exists", new_filename))
                         failed += 1
                         continue
 
                     if self.dry_run:
-                        self.log.emit(self.translator.get("preview_renamed", index, file_path.name, new_filename))
+                        self._log(self.translator.get("preview_renamed", index, file_path.name, new_filename))
                     else:
                         # Perform the rename
                         file_path.rename(new_path)
-                        self.log.emit(self.translator.get("renamed", index, file_path.name, new_filename))
+                        self._log(self.translator.get("renamed", index, file_path.name, new_filename))
 
                     successful += 1
 
                 except Exception as e:
-                    self.log.emit(self.translator.get("rename_error", file_path.name, str(e)))
+                    self._log(self.translator.get("rename_error", file_path.name, str(e)))
                     failed += 1
 
                 # Update progress
-                progress_percent = int((index) / len(sorted_files) * 100)
-                self.progress.emit(progress_percent)
+                self._emit_progress(successful + failed, total)
+
+            # Send the last value the throttle may have held back
+            self._emit_progress(successful + failed, total, force=True)
 
             # Emit final statistics
+            self._flush_logs()
             self.finished.emit({
                 'successful': successful,
                 'failed': failed,
-                'total': len(files)
+                'total': total
             })
 
         except Exception as e:
-            self.log.emit(self.translator.get("critical_error", str(e)))
+            self._log(self.translator.get("critical_error", str(e)))
+            self._flush_logs()
             self.finished.emit({
                 'successful': 0,
                 'failed': 0,
@@ -517,8 +772,12 @@ class MainWindow(QMainWindow):
         self.folder_input.setPlaceholderText(self.translator.get("select_video_folder"))
         self.browse_button.setText(self.translator.get("browse"))
         self.video_height_label.setText(self.translator.get("target_height"))
+        self.video_jobs_label.setText(self.translator.get("parallel_jobs"))
+        self.jobs_spinbox.setToolTip(self.translator.get("parallel_jobs_tooltip"))
         self.remove_audio_checkbox.setText(self.translator.get("remove_audio"))
         self.create_thumbs_checkbox.setText(self.translator.get("create_thumbs"))
+        self.use_gpu_checkbox.setText(self.translator.get("use_gpu"))
+        self.verbose_log_checkbox.setText(self.translator.get("verbose_log"))
         self.video_log_group.setTitle(self.translator.get("processing_log"))
         self.start_button.setText(self.translator.get("start_processing"))
         self.stop_button.setText(self.translator.get("stop"))
@@ -536,6 +795,9 @@ class MainWindow(QMainWindow):
         self.download_column_index_spinbox.setSpecialValueText(self.translator.get("not_used"))
         self.download_column_index_spinbox.setToolTip(self.translator.get("column_index_name_tooltip"))
         self.download_column_index_hint_label.setText(self.translator.get("column_index_name_hint"))
+        self.download_skip_hyperlinks_checkbox.setText(self.translator.get("skip_hyperlinks"))
+        self.download_workers_label.setText(self.translator.get("parallel_downloads"))
+        self.download_workers_spinbox.setToolTip(self.translator.get("parallel_downloads_tooltip"))
         self.download_log_group.setTitle(self.translator.get("download_log"))
         self.download_start_button.setText(self.translator.get("start_download"))
         self.download_stop_button.setText(self.translator.get("stop"))
@@ -622,6 +884,19 @@ class MainWindow(QMainWindow):
         height_layout.addStretch()
         input_layout.addLayout(height_layout)
 
+        # Parallel jobs setting
+        jobs_layout = QHBoxLayout()
+        self.video_jobs_label = QLabel(self.translator.get("parallel_jobs"))
+        jobs_layout.addWidget(self.video_jobs_label)
+        self.jobs_spinbox = QSpinBox()
+        self.jobs_spinbox.setMinimum(1)
+        self.jobs_spinbox.setMaximum(max(DEFAULT_VIDEO_JOBS, 32))
+        self.jobs_spinbox.setValue(DEFAULT_VIDEO_JOBS)
+        self.jobs_spinbox.setToolTip(self.translator.get("parallel_jobs_tooltip"))
+        jobs_layout.addWidget(self.jobs_spinbox)
+        jobs_layout.addStretch()
+        input_layout.addLayout(jobs_layout)
+
         # Options
         self.remove_audio_checkbox = QCheckBox(self.translator.get("remove_audio"))
         input_layout.addWidget(self.remove_audio_checkbox)
@@ -629,6 +904,13 @@ class MainWindow(QMainWindow):
         self.create_thumbs_checkbox = QCheckBox(self.translator.get("create_thumbs"))
         input_layout.addWidget(self.create_thumbs_checkbox)
 
+        self.use_gpu_checkbox = QCheckBox(self.translator.get("use_gpu"))
+        input_layout.addWidget(self.use_gpu_checkbox)
+
+        self.verbose_log_checkbox = QCheckBox(self.translator.get("verbose_log"))
+        self.verbose_log_checkbox.setChecked(True)
+        input_layout.addWidget(self.verbose_log_checkbox)
+
         self.video_input_group.setLayout(input_layout)
         tab_layout.addWidget(self.video_input_group)
 
@@ -642,6 +924,7 @@ class MainWindow(QMainWindow):
         log_layout = QVBoxLayout()
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
         self.log_text.setMaximumHeight(200)
         log_layout.addWidget(self.log_text)
         self.video_log_group.setLayout(log_layout)
@@ -726,6 +1009,23 @@ class MainWindow(QMainWindow):
         column_index_layout.addStretch()
         input_layout.addLayout(column_index_layout)
 
+        # Parallel downloads setting
+        download_workers_layout = QHBoxLayout()
+        self.download_workers_label = QLabel(self.translator.get("parallel_downloads"))
+        download_workers_layout.addWidget(self.download_workers_label)
+        self.download_workers_spinbox = QSpinBox()
+        self.download_workers_spinbox.setMinimum(1)
+        self.download_workers_spinbox.setMaximum(MAX_DOWNLOAD_WORKERS)
+        self.download_workers_spinbox.setValue(DEFAULT_DOWNLOAD_WORKERS)
+        self.download_workers_spinbox.setToolTip(self.translator.get("parallel_downloads_tooltip"))
+        download_workers_layout.addWidget(self.download_workers_spinbox)
+        download_workers_layout.addStretch()
+        input_layout.addLayout(download_workers_layout)
+
+        # Options
+        self.download_skip_hyperlinks_checkbox = QCheckBox(self.translator.get("skip_hyperlinks"))
+        input_layout.addWidget(self.download_skip_hyperlinks_checkbox)
+
         self.download_input_group.setLayout(input_layout)
         tab_layout.addWidget(self.download_input_group)
 
@@ -739,6 +1039,7 @@ class MainWindow(QMainWindow):
         log_layout = QVBoxLayout()
         self.download_log_text = QTextEdit()
         self.download_log_text.setReadOnly(True)
+        self.download_log_text.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
         self.download_log_text.setMaximumHeight(200)
         log_layout.addWidget(self.download_log_text)
         self.download_log_group.setLayout(log_layout)
@@ -873,6 +1174,7 @@ class MainWindow(QMainWindow):
         log_layout = QVBoxLayout()
         self.rename_log_text = QTextEdit()
         self.rename_log_text.setReadOnly(True)
+        self.rename_log_text.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
         self.rename_log_text.setMaximumHeight(200)
         log_layout.addWidget(self.rename_log_text)
         self.rename_log_group.setLayout(log_layout)
@@ -945,7 +1247,7 @@ class MainWindow(QMainWindow):
             return
 
         folder_path = Path(folder_path)
-        if not folder_path.exists() or not folder_path.is_dir():
+        if not folder_path.is_dir():
             QMessageBox.warning(
                 self,
                 self.translator.get("error"),
@@ -966,6 +1268,9 @@ class MainWindow(QMainWindow):
         height = self.height_spinbox.value()
         remove_audio = self.remove_audio_checkbox.isChecked()
         create_thumbs = self.create_thumbs_checkbox.isChecked()
+        jobs = self.jobs_spinbox.value()
+        use_gpu = self.use_gpu_checkbox.isChecked()
+        verbose = self.verbose_log_checkbox.isChecked()
 
         # Start processing thread
         self.processor_thread = VideoProcessorThread(
@@ -973,7 +1278,10 @@ class MainWindow(QMainWindow):
             height,
             remove_audio,
             create_thumbs,
-            self.translator
+            self.translator,
+            jobs=jobs,
+            use_gpu=use_gpu,
+            verbose=verbose
         )
         self.processor_thread.progress.connect(self.update_progress)
         self.processor_thread.log.connect(self.add_log)
@@ -986,20 +1294,35 @@ class MainWindow(QMainWindow):
         """Stop video processing."""
         if self.processor_thread and self.processor_thread.isRunning():
             self.processor_thread.stop()
-            self.add_log(self.translator.get("stopping_processing"))
+            self.add_log([self.translator.get("stopping_processing")])
             self.stop_button.setEnabled(False)
 
     def update_progress(self, value: int):
         """Update progress bar."""
         self.progress_bar.setValue(value)
 
-    def add_log(self, message: str):
-        """Add message to log."""
-        self.log_text.append(message)
+    def _show_completion_message(self, title: str, message: str):
+        """
+        Show a completion message box once the current slot has returned.
+
+        The modal dialog runs its own event loop, so it is opened from the main
+        event loop instead of inside the finished slot; the summary is drawn first.
+        """
+        QTimer.singleShot(0, partial(QMessageBox.information, self, title, message))
+
+    def _append_log(self, log_text: QTextEdit, messages: List[str]):
+        """Append a batch of messages to a log widget and scroll to the end once."""
+        # Repaint once after the whole batch is in
+        log_text.setUpdatesEnabled(False)
+        log_text.append("\n".join(messages))
+        log_text.setUpdatesEnabled(True)
         # Auto-scroll to bottom
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        self.log_text.setTextCursor(cursor)
+        scroll_bar = log_text.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+
+    def add_log(self, messages: List[str]):
+        """Add a batch of messages to log."""
+        self._append_log(self.log_text, messages)
 
     def processing_finished(self, stats: dict):
         """Handle processing completion."""
@@ -1009,24 +1332,26 @@ class MainWindow(QMainWindow):
         self.browse_button.setEnabled(True)
 
         # Show summary
-        self.add_log("\n" + "=" * 50)
-        self.add_log(self.translator.get("processing_complete_summary"))
-        self.add_log(self.translator.get("successful", stats['successful']))
-        self.add_log(self.translator.get("errors", stats['failed']))
-        self.add_log(self.translator.get("total", stats['total']))
+        summary = [
+            "\n" + "=" * 50,
+            self.translator.get("processing_complete_summary"),
+            self.translator.get("successful", stats['successful']),
+            self.translator.get("errors", stats['failed']),
+            self.translator.get("total", stats['total'])
+        ]
 
         if self.create_thumbs_checkbox.isChecked():
-            self.add_log(self.translator.get("thumbs_created", stats['thumbs_created']))
-            self.add_log(self.translator.get("thumbs_errors", stats['thumbs_failed']))
+            summary.append(self.translator.get("thumbs_created", stats['thumbs_created']))
+            summary.append(self.translator.get("thumbs_errors", stats['thumbs_failed']))
 
-        self.add_log("=" * 50)
+        summary.append("=" * 50)
+        self.add_log(summary)
 
         self.statusBar().showMessage(self.translator.get("ready"))
 
         # Show completion message
         if stats['total'] > 0:
-            QMessageBox.information(
-                self,
+            self._show_completion_message(
                 self.translator.get("processing_complete"),
                 self.translator.get("processing_complete_msg", stats['successful'], stats['total'])
             )
@@ -1044,7 +1369,7 @@ class MainWindow(QMainWindow):
             return
 
         file_path = Path(file_path)
-        if not file_path.exists() or not file_path.is_file():
+        if not file_path.is_file():
             QMessageBox.warning(
                 self,
                 self.translator.get("error"),
@@ -1089,7 +1414,14 @@ class MainWindow(QMainWindow):
             column_index_name = None
 
         # Start downloading thread
-        self.downloader_thread = FileDownloaderThread(file_path, output_folder, column_index_name, self.translator)
+        self.downloader_thread = FileDownloaderThread(
+            file_path,
+            output_folder,
+            column_index_name,
+            self.translator,
+            not self.download_skip_hyperlinks_checkbox.isChecked(),
+            self.download_workers_spinbox.value()
+        )
         self.downloader_thread.progress.connect(self.update_download_progress)
         self.downloader_thread.log.connect(self.add_download_log)
         self.downloader_thread.finished.connect(self.downloading_finished)
@@ -1101,20 +1433,16 @@ class MainWindow(QMainWindow):
         """Stop file downloading."""
         if self.downloader_thread and self.downloader_thread.isRunning():
             self.downloader_thread.stop()
-            self.add_download_log(self.translator.get("stopping_download"))
+            self.add_download_log([self.translator.get("stopping_download")])
             self.download_stop_button.setEnabled(False)
 
     def update_download_progress(self, value: int):
         """Update download progress bar."""
         self.download_progress_bar.setValue(value)
 
-    def add_download_log(self, message: str):
-        """Add message to download log."""
-        self.download_log_text.append(message)
-        # Auto-scroll to bottom
-        cursor = self.download_log_text.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        self.download_log_text.setTextCursor(cursor)
+    def add_download_log(self, messages: List[str]):
+        """Add a batch of messages to download log."""
+        self._append_log(self.download_log_text, messages)
 
     def downloading_finished(self, stats: dict):
         """Handle downloading completion."""
@@ -1125,22 +1453,24 @@ class MainWindow(QMainWindow):
         self.download_browse_folder_button.setEnabled(True)
 
         # Show summary
-        self.add_download_log("\n" + "=" * 50)
-        self.add_download_log(self.translator.get("download_complete_summary"))
-        self.add_download_log(self.translator.get("successful", stats['successful']))
-        self.add_download_log(self.translator.get("errors", stats['failed']))
-        self.add_download_log(self.translator.get("skipped", stats['skipped']))
+        summary = [
+            "\n" + "=" * 50,
+            self.translator.get("download_complete_summary"),
+            self.translator.get("successful", stats['successful']),
+            self.translator.get("errors", stats['failed']),
+            self.translator.get("skipped", stats['skipped'])
+        ]
         if stats.get('renamed', 0) > 0:
-            self.add_download_log(self.translator.get("renamed", stats['renamed']))
-        self.add_download_log(self.translator.get("total_urls", stats['total']))
-        self.add_download_log("=" * 50)
+            summary.append(self.translator.get("renamed", stats['renamed']))
+        summary.append(self.translator.get("total_urls", stats['total']))
+        summary.append("=" * 50)
+        self.add_download_log(summary)
 
         self.statusBar().showMessage(self.translator.get("ready"))
 
         # Show completion message
         if stats['total'] > 0:
-            QMessageBox.information(
-                self,
+            self._show_completion_message(
                 self.translator.get("download_complete"),
                 self.translator.get("download_complete_msg", stats['successful'], stats['total'])
             )
@@ -1169,7 +1499,7 @@ class MainWindow(QMainWindow):
             return
 
         folder_path = Path(folder_path)
-        if not folder_path.exists() or not folder_path.is_dir():
+        if not folder_path.is_dir():
             QMessageBox.warning(
                 self,
                 self.translator.get("error"),
@@ -1216,20 +1546,16 @@ class MainWindow(QMainWindow):
         """Stop file renaming."""
         if self.renamer_thread and self.renamer_thread.isRunning():
             self.renamer_thread.stop()
-            self.add_rename_log(self.translator.get("stopping_rename"))
+            self.add_rename_log([self.translator.get("stopping_rename")])
             self.rename_stop_button.setEnabled(False)
 
     def update_rename_progress(self, value: int):
         """Update rename progress bar."""
         self.rename_progress_bar.setValue(value)
 
-    def add_rename_log(self, message: str):
-        """Add message to rename log."""
-        self.rename_log_text.append(message)
-        # Auto-scroll to bottom
-        cursor = self.rename_log_text.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        self.rename_log_text.setTextCursor(cursor)
+    def add_rename_log(self, messages: List[str]):
+        """Add a batch of messages to rename log."""
+        self._append_log(self.rename_log_text, messages)
 
     def renaming_finished(self, stats: dict):
         """Handle renaming completion."""
@@ -1239,29 +1565,28 @@ class MainWindow(QMainWindow):
         self.rename_browse_button.setEnabled(True)
 
         # Show summary
-        self.add_rename_log("\n" + "=" * 50)
+        summary = ["\n" + "=" * 50]
         if self.rename_dry_run_checkbox.isChecked():
-            self.add_rename_log(self.translator.get("preview_complete"))
+            summary.append(self.translator.get("preview_complete"))
         else:
-            self.add_rename_log(self.translator.get("rename_complete_summary"))
-        self.add_rename_log(self.translator.get("successful", stats['successful']))
-        self.add_rename_log(self.translator.get("errors", stats['failed']))
-        self.add_rename_log(self.translator.get("total", stats['total']))
-        self.add_rename_log("=" * 50)
+            summary.append(self.translator.get("rename_complete_summary"))
+        summary.append(self.translator.get("successful", stats['successful']))
+        summary.append(self.translator.get("errors", stats['failed']))
+        summary.append(self.translator.get("total", stats['total']))
+        summary.append("=" * 50)
+        self.add_rename_log(summary)
 
         self.statusBar().showMessage(self.translator.get("ready"))
 
         # Show completion message
         if stats['total'] > 0:
             if self.rename_dry_run_checkbox.isChecked():
-                QMessageBox.information(
-                    self,
+                self._show_completion_message(
                     self.translator.get("rename_preview_complete"),
                     self.translator.get("rename_preview_msg", stats['successful'], stats['total'])
                 )
             else:
-                QMessageBox.information(
-                    self,
+                self._show_completion_message(
                     self.translator.get("rename_complete"),
                     self.translator.get("rename_complete_msg", stats['successful'], stats['total'])
                 )
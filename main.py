@@ -6,42 +6,149 @@ Processes all video files in a folder and saves them to an output folder.
 
 import argparse
 import os
+import subprocess
 import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple, Union
 
 from ffmpeg import FFmpeg
 
 
 # Common video file extensions
 VIDEO_EXTENSIONS = {'.mp4', '.avi', '.mkv', '.mov', '.flv', '.wmv', '.webm', '.m4v', '.mpeg', '.mpg'}
+# Same extensions as a tuple, for str.endswith
+VIDEO_SUFFIXES = tuple(VIDEO_EXTENSIONS)
 
+# Input options for decoding on an NVIDIA GPU; decoded frames stay in GPU memory
+# for the scale_cuda filter and the h264_nvenc encoder
+GPU_INPUT_OPTIONS = {"hwaccel": "cuda", "hwaccel_output_format": "cuda"}
 
-def get_video_files(folder_path: Path) -> List[Path]:
+# Videos encoded on the GPU at the same time. Consumer NVIDIA drivers allow only a
+# few NVENC sessions, and jobs over the limit would fail and fall back to the CPU
+GPU_MAX_SESSIONS = 2
+_gpu_sessions = threading.BoundedSemaphore(GPU_MAX_SESSIONS)
+
+# Thumbnail output options: extract 1 frame, skip audio, keep keyframe timestamps,
+# fixed JPG quality (2-31, lower is better)
+THUMBNAIL_OUTPUT_OPTIONS = {"vframes": 1, "an": None, "vsync": "passthrough", "qscale:v": 3}
+
+# Videos whose thumbnails are extracted by one ffmpeg process in create_thumbnails
+THUMBNAIL_BATCH_SIZE = 16
+
+# Number of videos encoded at the same time by default (ffmpeg runs as a separate
+# process per video). x264 already spreads one encode over all cores, so a few
+# jobs are enough and each one gets its share of the cores (see get_encoder_threads)
+DEFAULT_VIDEO_JOBS = max(1, (os.cpu_count() or 1) // 4)
+
+
+def get_encoder_threads(jobs: int) -> int:
     """
-    Get all video files from the specified folder.
+    Split the CPU cores between encodes running at the same time.
+
+    Without a limit every x264 encoder starts about 1.5 threads per core and its
+    own lookahead buffers, so parallel jobs would oversubscribe the CPU and
+    multiply memory use.
 
     Args:
-        folder_path: Path to the folder containing video files
+        jobs: Number of videos encoded at the same time
 
     Returns:
-        List of Path objects for video files
+        Number of threads for each encoder (at least 1)
     """
-    video_files = []
+    return max(1, (os.cpu_count() or 1) // max(1, jobs))
+
 
+def check_video_folder(folder_path: Path) -> bool:
+    """
+    Check that the video folder exists and is a directory, printing an error otherwise.
+
+    Args:
+        folder_path: Path to the folder containing video files
+
+    Returns:
+        True if the folder can be listed, False otherwise
+    """
     if not folder_path.exists():
         print(f"Error: Folder '{folder_path}' does not exist.")
-        return video_files
+        return False
 
     if not folder_path.is_dir():
         print(f"Error: '{folder_path}' is not a directory.")
-        return video_files
+        return False
 
-    for file_path in folder_path.iterdir():
-        if file_path.is_file() and file_path.suffix.lower() in VIDEO_EXTENSIONS:
-            video_files.append(file_path)
+    return True
 
-    return sorted(video_files)
+
+def iter_video_files(folder_path: Path) -> Iterator[Path]:
+    """
+    Yield the video files of a folder in directory order, without building a list.
+
+    Args:
+        folder_path: Path to an existing folder containing video files
+
+    Yields:
+        Path objects for video files
+    """
+    # scandir entries carry the file type, so no extra stat per file is needed
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith(VIDEO_SUFFIXES) and entry.is_file():
+                yield Path(entry.path)
+
+
+def get_video_files(folder_path: Path) -> List[Path]:
+    """
+    Get all video files from the specified folder.
+
+    Args:
+        folder_path: Path to the folder containing video files
+
+    Returns:
+        List of Path objects for video files
+    """
+    if not check_video_folder(folder_path):
+        return []
+
+    return sorted(iter_video_files(folder_path))
+
+
+def ffmpeg_command() -> FFmpeg:
+    """
+    Start an FFmpeg command that overwrites existing output files.
+
+    FFmpeg only writes errors to stderr (no banner, stream info or per-frame
+    statistics lines), so there is little for python-ffmpeg to read through
+    its unbuffered pipe; the last error line is still the FFmpegError message.
+
+    Returns:
+        FFmpeg instance with the global options set
+    """
+    return FFmpeg().option("y").option("hide_banner").option("nostats").option("loglevel", "error")
+
+
+def get_thumbnail_input_options(time_seconds: float = 1.0) -> Dict[str, Optional[Union[str, float]]]:
+    """
+    Build the FFmpeg input options for extracting a thumbnail.
+
+    Seeking before the input is fast (keyframe-based) and only keyframes are
+    decoded: the first keyframe at the seek point is the thumbnail.
+    -noaccurate_seek keeps the keyframe before the seek point, so short clips
+    with a single keyframe still produce a frame.
+
+    Args:
+        time_seconds: Time position in seconds to extract the frame from
+
+    Returns:
+        New dict of input options (python-ffmpeg updates the dict it is given)
+    """
+    return {
+        "ss": time_seconds,  # Seek to specific time
+        "noaccurate_seek": None,
+        "skip_frame": "nokey",
+        "threads": 0  # Let the decoder pick its thread count from the CPU cores
+    }
 
 
 def create_thumbnail(input_path: Path, output_path: Path, time_seconds: float = 1.0) -> bool:
@@ -58,17 +165,10 @@ def create_thumbnail(input_path: Path, output_path: Path, time_seconds: float =
     """
     try:
         # Create FFmpeg instance
-        # Use -ss before input for faster seeking (keyframe-based)
         ffmpeg = (
-            FFmpeg()
-            .option("y")  # Overwrite output file if exists
-            .option("ss", time_seconds)  # Seek to specific time
-            .input(str(input_path))
-            .output(
-                str(output_path),
-                {"vframes": 1},  # Extract 1 frame
-                vf="thumbnail"  # Use thumbnail filter to select best frame
-            )
+            ffmpeg_command()
+            .input(str(input_path), get_thumbnail_input_options(time_seconds))
+            .output(str(output_path), dict(THUMBNAIL_OUTPUT_OPTIONS))
         )
 
         ffmpeg.execute()
@@ -79,58 +179,266 @@ def create_thumbnail(input_path: Path, output_path: Path, time_seconds: float =
         return False
 
 
-def resize_video(input_path: Path, output_path: Path, height: int, remove_audio: bool = False) -> bool:
+def create_thumbnails(jobs: Sequence[Tuple[Path, Path]], time_seconds: float = 1.0) -> List[bool]:
     """
-    Resize a video file to the specified height while maintaining aspect ratio.
+    Extract thumbnails of several videos, THUMBNAIL_BATCH_SIZE videos per FFmpeg process.
+
+    Every video of a batch is a separate input mapped to its own JPG output, so
+    the frames are the same as with create_thumbnail, but FFmpeg is started
+    once per batch instead of once per video. If a batch fails (e.g. one of its
+    files has no video stream), its videos are retried one by one.
 
     Args:
-        input_path: Path to input video file
-        output_path: Path to output video file
-        height: Target height in pixels (width will be calculated automatically)
-        remove_audio: Whether to remove audio track
+        jobs: Sequence of (input video path, output JPG path) pairs
+        time_seconds: Time position in seconds to extract the frames from (default: 1.0)
 
     Returns:
-        True if successful, False otherwise
+        List with True for every thumbnail that was created, False otherwise,
+        in the order of jobs
+    """
+    results = []
+
+    for start in range(0, len(jobs), THUMBNAIL_BATCH_SIZE):
+        batch = jobs[start:start + THUMBNAIL_BATCH_SIZE]
+
+        try:
+            # JPGs left from an earlier run must not pass for this batch's frames below
+            for _, output_path in batch:
+                output_path.unlink(missing_ok=True)
+
+            ffmpeg = ffmpeg_command()
+            for input_path, _ in batch:
+                ffmpeg = ffmpeg.input(str(input_path), get_thumbnail_input_options(time_seconds))
+            for index, (_, output_path) in enumerate(batch):
+                ffmpeg = ffmpeg.output(str(output_path), {"map": f"{index}:v:0", **THUMBNAIL_OUTPUT_OPTIONS})
+
+            ffmpeg.execute()
+            results.extend(output_path.exists() for _, output_path in batch)
+
+        except Exception:
+            results.extend(
+                create_thumbnail(input_path, output_path, time_seconds)
+                for input_path, output_path in batch
+            )
+
+    return results
+
+
+@lru_cache(maxsize=1)
+def get_hwaccels() -> FrozenSet[str]:
+    """
+    Get the hardware acceleration methods supported by the installed FFmpeg.
+    FFmpeg is asked only once per run.
+
+    Returns:
+        Set of method names (e.g. 'cuda', 'vaapi'), empty if FFmpeg could not be run
     """
     try:
-        # Create FFmpeg instance
-        ffmpeg = FFmpeg().option("y").input(str(input_path))
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-hwaccels"],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return frozenset()
+
+    # The first line is the "Hardware acceleration methods:" header
+    return frozenset(line.strip() for line in result.stdout.splitlines()[1:] if line.strip())
+
 
-        # Build output options
+@lru_cache(maxsize=1)
+def get_encoders() -> FrozenSet[str]:
+    """
+    Get the names of the encoders of the installed FFmpeg.
+    FFmpeg is asked only once per run.
+
+    Returns:
+        Set of encoder names (e.g. 'libx264', 'h264_nvenc'), empty if FFmpeg could not be run
+    """
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return frozenset()
+
+    # The legend above the " ------" line is skipped; every row is "<flags> <name> <description>"
+    lines = result.stdout.splitlines()
+    start = next((i + 1 for i, line in enumerate(lines) if line.strip().startswith("---")), len(lines))
+    return frozenset(line.split()[1] for line in lines[start:] if len(line.split()) > 1)
+
+
+def is_gpu_available() -> bool:
+    """
+    Check whether videos can be resized on an NVIDIA GPU.
+
+    Returns:
+        True if FFmpeg supports CUDA decoding and has the NVENC H.264 encoder, False otherwise
+    """
+    return "cuda" in get_hwaccels() and "h264_nvenc" in get_encoders()
+
+
+@lru_cache(maxsize=32)
+def get_resize_options(height: int, remove_audio: bool = False, use_gpu: bool = False,
+                       threads: int = 0) -> Tuple[Tuple[str, Optional[Union[str, int]]], ...]:
+    """
+    Build the FFmpeg output options for resizing, once per height, audio, GPU and thread setting.
+
+    Args:
+        height: Target height in pixels (width will be calculated automatically)
+        remove_audio: Whether to remove audio track
+        use_gpu: Whether to scale and encode on an NVIDIA GPU
+        threads: Number of CPU encoder threads (0 lets x264 use all cores)
+
+    Returns:
+        Tuple of (option, value) pairs; a value of None is an option without a value.
+        It is a tuple because python-ffmpeg updates the options dict it is given,
+        so every call turns it into a new dict.
+    """
+    # Build output options
+    if use_gpu:
+        output_options = {
+            "codec:v": "h264_nvenc",
+            "preset": "p4",
+            "cq": 23
+        }
+    else:
         output_options = {
             "codec:v": "libx264",
             "preset": "medium",
             "crf": 23
         }
+        if threads:
+            output_options["threads"] = threads
 
-        # Set video filter for scaling (maintain aspect ratio)
-        vf = f"scale=-2:{height}"
+    # Configure audio
+    if remove_audio:
+        output_options["an"] = None  # Remove audio
+    else:
+        output_options["codec:a"] = "aac"  # Use AAC codec for audio
+        output_options["b:a"] = "128k"  # Audio bitrate
 
-        # Configure audio
-        if remove_audio:
-            output_options["an"] = None  # Remove audio
-        else:
-            output_options["codec:a"] = "aac"  # Use AAC codec for audio
-            output_options["b:a"] = "128k"  # Audio bitrate
-
-        # Add output with options
-        ffmpeg = ffmpeg.output(
-            str(output_path),
-            output_options,
-            vf=vf
+    # Set video filter for scaling (maintain aspect ratio)
+    output_options["vf"] = f"scale_cuda=-2:{height}" if use_gpu else f"scale=-2:{height}"
+
+    return tuple(output_options.items())
+
+
+def resize_video(input_path: Path, output_path: Path, height: int, remove_audio: bool = False,
+                 use_gpu: bool = False, threads: int = 0) -> bool:
+    """
+    Resize a video file to the specified height while maintaining aspect ratio.
+
+    Args:
+        input_path: Path to input video file
+        output_path: Path to output video file
+        height: Target height in pixels (width will be calculated automatically)
+        remove_audio: Whether to remove audio track
+        use_gpu: Whether to decode, scale and encode on an NVIDIA GPU when FFmpeg supports it;
+            the video is processed on the CPU if the GPU is not available or fails.
+            At most GPU_MAX_SESSIONS videos are encoded on the GPU at the same time
+        threads: Number of CPU encoder threads (0 lets x264 use all cores)
+
+    Returns:
+        True if successful, False otherwise
+    """
+    use_gpu = use_gpu and is_gpu_available()
+
+    try:
+        # Create FFmpeg instance with the options shared by all videos of the batch
+        ffmpeg = (
+            ffmpeg_command()
+            .input(str(input_path), dict(GPU_INPUT_OPTIONS) if use_gpu else None)
+            .output(str(output_path), dict(get_resize_options(height, remove_audio, use_gpu, threads)))
         )
 
         print(f"Processing: {input_path.name}")
-        ffmpeg.execute()
+        if use_gpu:
+            # Wait for a free NVENC session instead of failing over to the CPU
+            with _gpu_sessions:
+                ffmpeg.execute()
+        else:
+            ffmpeg.execute()
         print(f"Completed: {output_path.name}")
 
         return True
 
     except Exception as e:
+        if use_gpu:
+            print(f"GPU processing failed for {input_path.name}, retrying on CPU: {str(e)}")
+            return resize_video(input_path, output_path, height, remove_audio, threads=threads)
         print(f"Error processing {input_path.name}: {str(e)}")
         return False
 
 
+def resize_video_with_thumbnail(input_path: Path, output_path: Path, thumb_path: Path, height: int,
+                                remove_audio: bool = False, time_seconds: float = 1.0,
+                                threads: int = 0) -> Tuple[bool, bool]:
+    """
+    Resize a video on the CPU and save a JPG thumbnail of it in the same FFmpeg run.
+
+    The decoded frames are split into a video branch and a thumbnail branch, and
+    each branch is scaled on its own, so the video is decoded once and the resized
+    file is not read back. If the video is shorter than time_seconds, the thumbnail
+    is taken from the resized file with create_thumbnail; if the run fails,
+    resize_video is used instead.
+
+    Args:
+        input_path: Path to input video file
+        output_path: Path to output video file
+        thumb_path: Path to output JPG file
+        height: Target height in pixels (width will be calculated automatically)
+        remove_audio: Whether to remove audio track
+        time_seconds: Time position in seconds to take the thumbnail from (default: 1.0)
+        threads: Number of CPU encoder threads (0 lets x264 use all cores)
+
+    Returns:
+        Tuple of (video resized, thumbnail created)
+    """
+    # Both branches scale on their own, so each encoder gets its own pixel format;
+    # the thumbnail branch keeps only the first frame at time_seconds before scaling
+    output_options = dict(get_resize_options(height, remove_audio, threads=threads))
+    del output_options["vf"]
+    filter_graph = (
+        f"[0:v:0]split=2[video_in][thumb_in];"
+        f"[video_in]scale=-2:{height}[video];"
+        f"[thumb_in]select='gte(t,{time_seconds})*eq(selected_n,0)',scale=-2:{height}[thumb]"
+    )
+    video_streams = ["[video]"] if remove_audio else ["[video]", "0:a:0?"]
+
+    try:
+        # A JPG left from an earlier run must not pass for this run's frame below
+        thumb_path.unlink(missing_ok=True)
+
+        ffmpeg = (
+            ffmpeg_command()
+            .option("filter_complex", filter_graph)
+            .input(str(input_path))
+            .output(str(output_path), {"map": video_streams, **output_options})
+            .output(str(thumb_path), {"map": "[thumb]", **THUMBNAIL_OUTPUT_OPTIONS})
+        )
+
+        print(f"Processing: {input_path.name}")
+        ffmpeg.execute()
+        print(f"Completed: {output_path.name}")
+
+    except Exception as e:
+        print(f"Error processing {input_path.name} with thumbnail, retrying without: {str(e)}")
+        if not resize_video(input_path, output_path, height, remove_audio, threads=threads):
+            return False, False
+        return True, create_thumbnail(output_path, thumb_path, time_seconds)
+
+    # No frame at time_seconds: the video is shorter than that
+    if not thumb_path.exists():
+        return True, create_thumbnail(output_path, thumb_path, time_seconds)
+
+    return True, True
+
+
 def main():
     """Main entry point for the script."""
     parser = argparse.ArgumentParser(
@@ -141,6 +449,7 @@ Examples:
   python main.py /path/to/videos 720
   python main.py /path/to/videos 1080 --remove-audio
   python main.py /path/to/videos 720 --create-thumbs
+  python main.py /path/to/videos 720 --gpu
         """
     )
 
@@ -168,8 +477,17 @@ Examples:
         help="Create JPG thumbnails in 'thumbs' folder (one frame from each video)"
     )
 
+    parser.add_argument(
+        "--gpu",
+        action="store_true",
+        help="Decode, scale and encode on an NVIDIA GPU (CUDA/NVENC) when FFmpeg supports it"
+    )
+
     args = parser.parse_args()
 
+    if args.gpu and not is_gpu_available():
+        print("Warning: FFmpeg does not support CUDA here, videos are processed on the CPU.")
+
     # Convert folder path to Path object
     folder_path = Path(args.folder).resolve()
 
@@ -200,19 +518,25 @@ Examples:
     thumbs_created = 0
     thumbs_failed = 0
 
+    thumb_jobs = []
+
     for video_file in video_files:
         output_path = output_dir / video_file.name
 
-        if resize_video(video_file, output_path, args.height, args.remove_audio):
+        if resize_video(video_file, output_path, args.height, args.remove_audio, args.gpu):
             successful += 1
+
+            # Queue thumbnail if requested; they are created in batches afterwards
+            if args.create_thumbs:
+                thumb_jobs.append((output_path, thumbs_dir / f"{video_file.stem}.jpg"))
         else:
             failed += 1
 
-        # Create thumbnail if requested
-        if args.create_thumbs:
-            thumb_path = thumbs_dir / f"{video_file.stem}.jpg"
-            print(f"Creating thumbnail: {thumb_path.name}")
-            if create_thumbnail(output_path, thumb_path):
+    # Create thumbnails if requested
+    if thumb_jobs:
+        print(f"Creating {len(thumb_jobs)} thumbnail(s)...")
+        for (_, thumb_path), created in zip(thumb_jobs, create_thumbnails(thumb_jobs)):
+            if created:
                 thumbs_created += 1
                 print(f"Thumbnail created: {thumb_path.name}")
             else:
@@ -9,7 +9,14 @@ import os
 import re
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
+
+# Patterns used by the renaming strategies, compiled once
+NUMBER_PATTERN = re.compile(r'\d+')
+NUMBER_SPLIT_PATTERN = re.compile(r'(\d+)')
+# A non-digit followed by one or more digits at the end
+NUMBER_AT_END_PATTERN = re.compile(r'\D(\d+)$')
+WHITESPACE_PATTERN = re.compile(r'\s+')
 
 
 def extract_number_from_filename(filename: str) -> Tuple[int, str]:
@@ -23,7 +30,7 @@ def extract_number_from_filename(filename: str) -> Tuple[int, str]:
         Tuple of (number, remaining_text). If no number found, returns (0, filename)
     """
     # Search for first sequence of digits
-    match = re.search(r'\d+', filename)
+    match = NUMBER_PATTERN.search(filename)
     if match:
         number = int(match.group())
         # Remove the number from text
@@ -47,12 +54,9 @@ def natural_sort_key(filename: str) -> List:
         "file2.txt" -> ["file", 2, ".txt"]
         This way file2.txt comes before file10.txt
     """
-    parts = []
-    for part in re.split(r'(\d+)', filename):
-        if part.isdigit():
-            parts.append(int(part))
-        else:
-            parts.append(part.lower())
+    parts = NUMBER_SPLIT_PATTERN.split(filename.lower())
+    # split() with a capturing group puts the digit runs at the odd positions
+    parts[1::2] = map(int, parts[1::2])
     return parts
 
 
@@ -72,8 +76,7 @@ def extract_number_at_end(filename: str) -> int:
         "file123" -> 0 (no non-digit before the number)
         "abc" -> 0 (no number)
     """
-    # Match a non-digit followed by one or more digits at the end
-    match = re.search(r'\D(\d+)$', filename)
+    match = NUMBER_AT_END_PATTERN.search(filename)
     if match:
         return int(match.group(1))
     return 0
@@ -89,7 +92,7 @@ def extract_text_only(filename: str) -> str:
     Returns:
         Filename with digits removed
     """
-    return re.sub(r'\d+', '', filename)
+    return NUMBER_PATTERN.sub('', filename)
 
 
 def extract_numbers_only(filename: str) -> str:
@@ -102,7 +105,7 @@ def extract_numbers_only(filename: str) -> str:
     Returns:
         String containing only the digits found, or empty string if none
     """
-    numbers = re.findall(r'\d+', filename)
+    numbers = NUMBER_PATTERN.findall(filename)
     return ''.join(numbers)
 
 
@@ -126,9 +129,11 @@ def get_files_in_folder(folder_path: Path) -> List[Path]:
         print(f"Error: '{folder_path}' is not a directory.")
         return files
 
-    for item in folder_path.iterdir():
-        if item.is_file():
-            files.append(item)
+    # scandir entries carry the file type, so no extra stat per file is needed
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                files.append(Path(entry.path))
 
     return files
 
@@ -191,7 +196,7 @@ def generate_new_filename(
         # Extract only text (remove numbers) from original filename
         text = extract_text_only(stem)
         # Clean up multiple spaces and trim
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = WHITESPACE_PATTERN.sub(' ', text).strip()
         new_name = text if text else f"file_{index}"
     elif rename_type == 'numbers_only_at_end':
         # Extract the number at the end of filename (if preceded by non-digit)
@@ -212,6 +217,54 @@ def generate_new_filename(
     return final_name
 
 
+def plan_renames(
+    sorted_files: List[Path],
+    rename_type: str,
+    prefix: str = "",
+    suffix: str = "",
+    zero_num: int = 0
+) -> Iterator[Tuple[int, Path, str]]:
+    """
+    Generate the new names for already sorted files, without touching the folder.
+    The same sorted list can be planned several times with different options.
+
+    Args:
+        sorted_files: Files in the order they should be numbered
+        rename_type: Renaming strategy - 'sequential', 'numbers_only', 'text_only', or 'numbers_only_at_end'
+        prefix: Optional prefix to add to filenames
+        suffix: Optional suffix to add to filenames
+        zero_num: Number of zeros for padding (default 0 - no padding)
+
+    Yields:
+        Tuple of (index, file_path, new_filename); duplicate new names get a counter
+    """
+    # Keep track of new names to avoid duplicates
+    used_names = set()
+    # Next counter to try for a generated name; the lower ones are already taken,
+    # so many files with the same name do not rescan all earlier counters
+    next_counters = {}
+
+    for index, file_path in enumerate(sorted_files, start=1):
+        # Generate new filename
+        new_filename = generate_new_filename(
+            file_path, index, rename_type, prefix, suffix, zero_num
+        )
+
+        # Handle duplicate names by adding a counter
+        if new_filename in used_names:
+            original_new_filename = new_filename
+            counter = next_counters.get(original_new_filename, 1)
+            # Insert counter before extension
+            stem, ext = os.path.splitext(original_new_filename)
+            while new_filename in used_names:
+                new_filename = f"{stem}_{counter}{ext}"
+                counter += 1
+            next_counters[original_new_filename] = counter
+
+        used_names.add(new_filename)
+        yield index, file_path, new_filename
+
+
 def rename_files(
     folder_path: Path,
     sort_type: str,
@@ -255,31 +308,14 @@ def rename_files(
     successful = 0
     failed = 0
 
-    # Keep track of new names to avoid duplicates
-    used_names = set()
-
-    for index, file_path in enumerate(sorted_files, start=1):
+    for index, file_path, new_filename in plan_renames(sorted_files, rename_type, prefix, suffix, zero_num):
         try:
-            # Generate new filename
-            new_filename = generate_new_filename(
-                file_path, index, rename_type, prefix, suffix, zero_num
-            )
-
-            # Handle duplicate names by adding a counter
-            original_new_filename = new_filename
-            counter = 1
-            while new_filename in used_names:
-                # Insert counter before extension
-                stem = Path(original_new_filename).stem
-                ext = Path(original_new_filename).suffix
-                new_filename = f"{stem}_{counter}{ext}"
-                counter += 1
-
-            used_names.add(new_filename)
             new_path = file_path.parent / new_filename
 
-            # Check if target file already exists (and it's not the same file)
-            if new_path.exists() and new_path.resolve() != file_path.resolve():
+            # Check if target file already exists (and it's not the same file; both
+            # are in the same folder, so comparing names is enough, except on case-insensitive
+            # filesystems, where a case-only rename finds the source file itself)
+            if new_filename != file_path.name and new_path.exists() and not new_path.samefile(file_path):
                 print(f"Error: Target file already exists: {new_filename}")
                 failed += 1
                 continue
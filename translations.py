@@ -33,8 +33,12 @@ class Translations:
         "browse": "Browse...",
         "select_video_folder_dialog": "Select folder with video files",
         "target_height": "Target height (px):",
+        "parallel_jobs": "Parallel jobs:",
+        "parallel_jobs_tooltip": "Number of videos processed at the same time",
         "remove_audio": "Remove audio track",
         "create_thumbs": "Create thumbnails (JPG)",
+        "use_gpu": "Use NVIDIA GPU (CUDA) when available",
+        "verbose_log": "Detailed log (every step of every file)",
         "processing_log": "Processing Log",
         "start_processing": "Start Processing",
         "stop": "Stop",
@@ -44,6 +48,8 @@ class Translations:
         "videos_found": "Found {} video file(s) in '{}'",
         "output_folder": "Output folder: {}",
         "thumbs_folder": "Thumbnails folder: {}",
+        "gpu_enabled": "Videos are processed on the NVIDIA GPU (CUDA)",
+        "gpu_not_available": "FFmpeg does not support CUDA here, videos are processed on the CPU",
         "processing_file": "Processing: {}",
         "completed": "Completed: {}",
         "error_processing": "Error processing: {}",
@@ -94,6 +100,9 @@ class Translations:
         "column_index_name_tooltip": "Column index (0-based) to use for custom filename. -1 = not used",
         "column_index_name_hint": "(-1 = not used, 0 = first column, 1 = second, etc.)",
         "not_used": "Not used",
+        "skip_hyperlinks": "Ignore hyperlinks in XLSX cells (faster with a filename column)",
+        "parallel_downloads": "Parallel downloads:",
+        "parallel_downloads_tooltip": "Number of files downloaded at the same time",
         "renamed_existing": "Renamed existing file: {} -> {}",
         "downloaded_renamed": "Downloaded and renamed: {}",
         "downloaded_rename_failed": "Downloaded as {}, but failed to rename: {}",
@@ -174,8 +183,12 @@ class Translations:
         "browse": "Обзор...",
         "select_video_folder_dialog": "Выберите папку с видеофайлами",
         "target_height": "Целевая высота (px):",
+        "parallel_jobs": "Параллельных задач:",
+        "parallel_jobs_tooltip": "Количество видео, обрабатываемых одновременно",
         "remove_audio": "Удалить звуковую дорожку",
         "create_thumbs": "Создать миниатюры (JPG)",
+        "use_gpu": "Использовать видеокарту NVIDIA (CUDA), если доступна",
+        "verbose_log": "Подробный журнал (каждый шаг для каждого файла)",
         "processing_log": "Журнал обработки",
         "start_processing": "Начать обработку",
         "stop": "Остановить",
@@ -185,6 +198,8 @@ class Translations:
         "videos_found": "Найдено {} видеофайл(ов) в '{}'",
         "output_folder": "Папка для вывода: {}",
         "thumbs_folder": "Папка для миниатюр: {}",
+        "gpu_enabled": "Видео обрабатываются на видеокарте NVIDIA (CUDA)",
+        "gpu_not_available": "FFmpeg не поддерживает CUDA на этом компьютере, видео обрабатываются на процессоре",
         "processing_file": "Обработка: {}",
         "completed": "Завершено: {}",
         "error_processing": "Ошибка при обработке: {}",
@@ -235,6 +250,9 @@ class Translations:
         "column_index_name_tooltip": "Индекс колонки (начиная с 0) для пользовательского имени файла. -1 = не используется",
         "column_index_name_hint": "(-1 = не используется, 0 = первая колонка, 1 = вторая и т.д.)",
         "not_used": "Не используется",
+        "skip_hyperlinks": "Не учитывать гиперссылки в ячейках XLSX (быстрее с колонкой имени)",
+        "parallel_downloads": "Параллельных загрузок:",
+        "parallel_downloads_tooltip": "Количество файлов, загружаемых одновременно",
         "renamed_existing": "Переименован существующий файл: {} -> {}",
         "downloaded_renamed": "Загружено и переименовано: {}",
         "downloaded_rename_failed": "Загружено как {}, но не удалось переименовать: {}",
@@ -292,6 +310,10 @@ class Translations:
         "language_ru": "Русский",
     }
 
+    # Key sets of both languages, built once at import
+    _EN_KEYSET = frozenset(EN)
+    _RU_KEYSET = frozenset(RU)
+
     def __init__(self, language: str = "en"):
         """
         Initialize translations manager.